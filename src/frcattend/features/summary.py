@@ -1,34 +1,47 @@
 """An attendance summary report in markdown format."""
 
+import os
+import pathlib
+
 from frcattend import config, model
 
+_summary_cache: "tuple[tuple, str] | None" = None
+"""Cache key and markdown from the most recent get_summary call."""
+
+
+def _summary_cache_key(db_path: pathlib.Path) -> tuple:
+    """Key that changes whenever the database file is modified.
+
+    The -wal file is folded into the key because in WAL mode recent writes
+    live there until a checkpoint updates the main database file.
+    """
+    file_info = os.stat(db_path)
+    key = [str(db_path), file_info.st_mtime_ns, file_info.st_size]
+    wal_path = db_path.with_name(db_path.name + "-wal")
+    if wal_path.exists():
+        wal_info = os.stat(wal_path)
+        key.extend([wal_info.st_mtime_ns, wal_info.st_size])
+    return tuple(key)
+
 
 def get_summary() -> str:
-    """Get attendance summary report in markdown."""
+    """Get attendance summary report in markdown.
+
+    The report is rebuilt only when the database file has changed since the
+    previous call.
+    """
+    global _summary_cache
     if config.settings.db_path is None:
         return ""
-    dbase = model.DBase(config.settings.db_path)
-    db_info = dbase.get_database_file_info()
-    accessed_on = db_info.access_time.replace(microsecond=0).isoformat()
-    modified_on = db_info.modification_time.replace(microsecond=0).isoformat()
-    created_on = db_info.creation_time.replace(microsecond=0).isoformat()
-    summary = [
-        "## File Info",
-        "| File | Last Accessed | Last Modified | Created On |",
-        "| ---- | ------------- | ------------- | ---------- |",
-        f"| {dbase.db_path.name} | {accessed_on} | {modified_on} | {created_on} |",
-    ]
-    students = model.Student.summary(dbase)
-    summary.extend(
-        [
-            "## Students",
-            "| Active | Deactivated | Total |",
-            "| ------ | ----------- | ----- |",
-            f"| {students['active']} | {students['deactivated']} | {students['total']} |",
-        ]
-    )
-    events = model.Event.summary(dbase)
-    checkins = model.Checkin.summary(dbase)
+    cache_key = _summary_cache_key(config.settings.db_path)
+    if _summary_cache is not None and _summary_cache[0] == cache_key:
+        return _summary_cache[1]
+    with model.DBase(config.settings.db_path) as dbase:
+        db_info = dbase.get_database_file_info()
+        aggregates = dbase.get_report_aggregates()
+    students = aggregates["students"]
+    events = aggregates["events"]
+    checkins = aggregates["checkins"]
     if checkins["earliest"] is None:
         earliest_checkin_time = None
     else:
@@ -37,21 +50,20 @@ def get_summary() -> str:
         latest_checkin_time = None
     else:
         latest_checkin_time = checkins["latest"][:19]
-    summary.extend(
-        [
-            "## Events and Checkins",
-            "| Total Events | First Event | First Checkin | Last Event | Last Checkin |",
-            "| ------------ | ----------- | ------------- | ---------- | ------------ |",
-            (
-                f"| {events['total']} | {events['earliest']} "
-                f"| {earliest_checkin_time} "
-                f"| {events['latest']} "
-                f"| {latest_checkin_time} |"
-            ),
-        ]
-    )
-
-    return str("\n".join(summary))
+    markdown = f"""## File Info
+| File | Last Accessed | Last Modified | Created On |
+| ---- | ------------- | ------------- | ---------- |
+| {dbase.db_path.name} | {db_info.access_iso} | {db_info.modification_iso} | {db_info.creation_iso} |
+## Students
+| Active | Deactivated | Total |
+| ------ | ----------- | ----- |
+| {students["active"]} | {students["deactivated"]} | {students["total"]} |
+## Events and Checkins
+| Total Events | First Event | First Checkin | Last Event | Last Checkin |
+| ------------ | ----------- | ------------- | ---------- | ------------ |
+| {events["total"]} | {events["earliest"]} | {earliest_checkin_time} | {events["latest"]} | {latest_checkin_time} |"""
+    _summary_cache = (cache_key, markdown)
+    return markdown
 
 
 # test_database.py os.stat_result(
@@ -2,7 +2,7 @@
 
 # ruff: noqa: F401
 from frcattend.model.students import Student
-from frcattend.model.surveys import Answer, Survey
+from frcattend.model.surveys import Answer, LazyAnswer, Survey
 from frcattend.model.events_checkins import Event, EventType, EventUpateError, Checkin
 from frcattend.model.database import DBase, DBaseError
 from frcattend.model.attendance import Attendance, AttendanceStudent
@@ -2,6 +2,7 @@
 
 import dataclasses
 import datetime
+import itertools
 import sqlite3
 from typing import Optional
 
@@ -9,34 +10,75 @@ from frcattend import config
 from frcattend import model
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class AttendanceStudent(model.Student):
     """Student record with attendance totals."""
 
     year_checkins: int
     build_checkins: int
+    last_checkin: datetime.date
 
     def __init__(
         self,
         student_id: str,
-        first_name: str,
         last_name: str,
+        first_name: str,
         grad_year: int,
         email: str,
+        deactivated_on: Optional[datetime.date | str],
         year_checkins: int,
         build_checkins: int,
         last_checkin: datetime.date,
-        deactivated_on: Optional[datetime.date | str] = None,
     ) -> None:
-        """A student record with checkin totals for the current season."""
+        """A student record with checkin totals for the current season.
+
+        Parameters are in the same order as the columns returned by
+        Attendance.get_student_attendance_cursor, so instances can be
+        built positionally straight from cursor rows.
+        """
         self.year_checkins = year_checkins
         self.build_checkins = build_checkins
         self.last_checkin = last_checkin
-        super().__init__(
-            student_id, first_name, last_name, grad_year, email, deactivated_on
+        # Zero-arg super() can't be used here: dataclass(slots=True)
+        # rebuilds the class, so the method's class cell points at the
+        # pre-decorator class and super() raises TypeError.
+        model.Student.__init__(
+            self, student_id, first_name, last_name, grad_year, email, deactivated_on
         )
 
 
+# The school year starts before the build season, so one scan of checkins
+# filtered on :year_start can compute both totals with conditional
+# aggregation, instead of one grouped scan per total.
+_ATTENDANCE_QUERY_TEMPLATE = """
+        WITH season_checkins AS (
+            SELECT student_id,
+                   COUNT(*) AS year_checkins,
+                   SUM(timestamp >= :build_start) AS build_checkins,
+                   MAX(event_date) AS last_checkin
+              FROM checkins
+             WHERE timestamp >= :year_start
+          GROUP BY student_id
+        )
+        SELECT s.student_id, s.last_name, s.first_name, s.grad_year,
+               s.email, s.deactivated_on,
+               COALESCE(c.year_checkins, 0) AS year_checkins,
+               COALESCE(c.build_checkins, 0) AS build_checkins,
+               c.last_checkin
+          FROM {relation} AS s
+     LEFT JOIN season_checkins AS c
+            ON c.student_id = s.student_id
+      ORDER BY last_name, first_name;
+"""
+
+# Pre-format both variants so each call passes the same string object to
+# execute, letting sqlite3's statement cache skip the parse/prepare step.
+_ATTENDANCE_QUERIES = {
+    True: _ATTENDANCE_QUERY_TEMPLATE.format(relation="students"),
+    False: _ATTENDANCE_QUERY_TEMPLATE.format(relation="active_students"),
+}
+
+
 class Attendance:
     """Manage multi-table queries ana analysis."""
 
@@ -48,34 +90,7 @@ class Attendance:
 
         Caller must close the cursor.
         """
-        relation = "students" if include_inactive else "active_students"
-        # An 'app' is an appearance.
-        query = f"""
-                WITH year_checkins AS (
-                    SELECT student_id, COUNT(student_id) as checkins,
-                           MAX(event_date) as last_checkin
-                      FROM checkins
-                     WHERE timestamp >= :year_start
-                  GROUP BY student_id
-                ),
-                build_checkins AS (
-                    SELECT student_id, COUNT(student_id) as checkins
-                      FROM checkins
-                     WHERE timestamp >= :build_start
-                  GROUP BY student_id
-                )
-                SELECT s.student_id, s.last_name, s.first_name, s.grad_year,
-                       s.email, s.deactivated_on,
-                       COALESCE(y.checkins, 0) AS year_checkins,
-                       COALESCE(b.checkins, 0) AS build_checkins,
-                       y.last_checkin
-                  FROM {relation} AS s
-             LEFT JOIN year_checkins AS y
-                    ON y.student_id = s.student_id
-             LEFT JOIN build_checkins AS b
-                    ON b.student_id = s.student_id
-              ORDER BY last_name, first_name;
-        """
+        query = _ATTENDANCE_QUERIES[include_inactive]
         conn = dbase.get_db_connection()
         cursor = conn.execute(
             query,
@@ -92,6 +107,14 @@ class Attendance:
     ) -> list[AttendanceStudent]:
         """Get a list of AttendanceStudent objects."""
         cursor = cls.get_student_attendance_cursor(dbase, include_inactive)
-        students = [AttendanceStudent(**dict(row)) for row in cursor]
-        cursor.connection.close()
+        # Rows are unpacked positionally; the SELECT list matches the
+        # AttendanceStudent parameter order. Fetching in fixed-size batches
+        # bounds the cursor's buffer for large rosters.
+        cursor.arraysize = 1024
+        students: list[AttendanceStudent] = []
+        try:
+            while rows := cursor.fetchmany():
+                students.extend(itertools.starmap(AttendanceStudent, rows))
+        finally:
+            cursor.connection.close()
         return students
@@ -1,13 +1,16 @@
 """Connect to the Sqlite database and run queries."""
 
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
+import contextlib
 import dataclasses
 import datetime
 import json
 import os
 import pathlib
+import queue
 import sqlite3
-from typing import Any
+import threading
+from typing import Any, ClassVar
 
 
 from frcattend.model import events_checkins, students, surveys
@@ -30,28 +33,26 @@ class DBaseError(Exception):
 # See https://docs.python.org/3/library/sqlite3.html#how-to-convert-sqlite-values-to-custom-python-types
 
 
-def adapt_from_date(val: datetime.date | None) -> str | None:
-    """Convert dates to ISO-formatted strings for storing in Sqlite."""
-    return None if val is None else val.isoformat()
+# Bind the hot conversion functions at module scope so converters avoid
+# repeated global/attribute lookups; adapters and converters fire once per
+# value on every row.
+_date_fromisoformat = datetime.date.fromisoformat
+_datetime_fromisoformat = datetime.datetime.fromisoformat
+_decode = bytes.decode
 
 
 def convert_to_date(val: bytes | None) -> datetime.date | None:
-    """Convert Sqlite event_date strings to EventType objects."""
+    """Convert Sqlite event_date strings to datetime.date objects."""
     if val is None:
         return None
-    return datetime.date.fromisoformat(val.decode())
-
-
-def adapt_from_datetime(val: datetime.datetime | None) -> str | None:
-    """Convert datetimes to ISO-formatted strings for storingin Sqlite."""
-    return None if val is None else val.isoformat()
+    return _date_fromisoformat(_decode(val))
 
 
 def convert_to_datetime(val: bytes | None) -> datetime.datetime | None:
     """convert Sqlite DATETIME columns to Python datetime objects."""
     if val is None:
         return None
-    return datetime.datetime.fromisoformat(val.decode())
+    return _datetime_fromisoformat(_decode(val))
 
 
 def convert_to_bool(val: bytes) -> bool:
@@ -59,9 +60,11 @@ def convert_to_bool(val: bytes) -> bool:
     return int(val) != 0
 
 
-sqlite3.register_adapter(datetime.date, adapt_from_date)
+# Adapters never receive None (sqlite3 binds None as NULL directly), so the
+# isoformat methods can be registered as adapters with no wrapper function.
+sqlite3.register_adapter(datetime.date, datetime.date.isoformat)
 sqlite3.register_converter("DATE", convert_to_date)
-sqlite3.register_adapter(datetime.datetime, adapt_from_datetime)
+sqlite3.register_adapter(datetime.datetime, datetime.datetime.isoformat)
 sqlite3.register_converter("DATETIME", convert_to_datetime)
 sqlite3.register_converter("BOOL", convert_to_bool)
 
@@ -78,6 +81,65 @@ class DbInfo:
     modification_time: datetime.datetime
     creation_time: datetime.datetime
 
+    _ISO_SECONDS: ClassVar[str] = "%Y-%m-%dT%H:%M:%S"
+    """Timestamp format used in reports: ISO-8601 truncated to seconds."""
+
+    @property
+    def access_iso(self) -> str:
+        """Access time as an ISO-8601 string without microseconds."""
+        return self.access_time.strftime(self._ISO_SECONDS)
+
+    @property
+    def modification_iso(self) -> str:
+        """Modification time as an ISO-8601 string without microseconds."""
+        return self.modification_time.strftime(self._ISO_SECONDS)
+
+    @property
+    def creation_iso(self) -> str:
+        """Creation time as an ISO-8601 string without microseconds."""
+        return self.creation_time.strftime(self._ISO_SECONDS)
+
+
+_CONNECTION_PRAGMAS = """
+    PRAGMA journal_mode = WAL;
+    PRAGMA synchronous = NORMAL;
+    PRAGMA temp_store = MEMORY;
+    PRAGMA cache_size = -64000;
+    PRAGMA mmap_size = 268435456;
+    PRAGMA foreign_keys = ON;
+"""
+"""Pragmas that are run once on each new connection.
+
+Opening a Sqlite connection is expensive and each connection keeps its own
+page cache, so connections are pooled per database file and reused instead
+of being opened and closed per query.
+"""
+
+
+class _PooledConnection(sqlite3.Connection):
+    """Connection that is returned to the DBase pool instead of closed.
+
+    Query methods call close() on the connections they receive from
+    get_db_connection. Returning the connection to the pool on close()
+    keeps its page cache warm for the next query. DBase pins the
+    connection while it is used as a shared connection inside a with
+    block, and closes it for real via really_close().
+    """
+
+    db_path: pathlib.Path
+    db_file_id: tuple[int, int]
+    """Device and inode of the database file, used to detect stale connections."""
+    pinned: bool = False
+
+    def close(self) -> None:
+        """Return the connection to the pool instead of closing it."""
+        if not self.pinned:
+            DBase._release_connection(self)
+
+    def really_close(self) -> None:
+        """Close the underlying Sqlite connection."""
+        super().close()
+
 
 class DBase:
     """Read and write to database."""
@@ -85,9 +147,25 @@ class DBase:
     db_path: pathlib.Path
     """Path to Sqlite database."""
 
+    _conn: "_PooledConnection | None"
+    """Shared connection used for all queries while inside a with block."""
+
+    _pool: "ClassVar[dict[pathlib.Path, queue.LifoQueue[_PooledConnection]]]" = {}
+    """Idle connections available for reuse, keyed by database file."""
+    _pool_lock: ClassVar[threading.Lock] = threading.Lock()
+    _pool_size: ClassVar[int] = 4
+    """Max idle connections retained per database file."""
+    _import_batch_size: ClassVar[int] = 10_000
+    """Rows inserted per executemany call in load_from_dict."""
+
+    _stat_cache: "tuple[int, DbInfo] | None"
+    """Modification time and DbInfo from the last get_database_file_info call."""
+
     def __init__(self, db_path: pathlib.Path, create_new: bool = False) -> None:
         """Set database path."""
         self.db_path = db_path
+        self._conn = None
+        self._stat_cache = None
         if create_new:
             if self.db_path.exists():
                 raise DBaseError(
@@ -99,13 +177,124 @@ class DBase:
             if not db_path.exists():
                 raise DBaseError(f"Database file at {db_path} does not exist.")
 
+    def __enter__(self) -> "DBase":
+        """Pin a single pooled connection that is reused for all queries."""
+        self._conn = self._checkout_connection()
+        self._conn.pinned = True
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Unpin the shared connection and return it to the pool."""
+        if self._conn is not None:
+            self._conn.pinned = False
+            self._conn.close()
+            self._conn = None
+
+    def _db_file_id(self) -> tuple[int, int]:
+        """Device and inode that identify the current database file."""
+        file_info = os.stat(self.db_path)
+        return (file_info.st_dev, file_info.st_ino)
+
+    def _checkout_connection(self) -> _PooledConnection:
+        """Pop an idle connection from the pool, or open a new one.
+
+        Pooled connections to a database file that has since been deleted or
+        replaced are discarded.
+        """
+        with DBase._pool_lock:
+            idle = DBase._pool.get(self.db_path)
+        file_id = self._db_file_id() if self.db_path.exists() else None
+        while idle is not None:
+            try:
+                conn = idle.get_nowait()
+            except queue.Empty:
+                break
+            if conn.db_file_id == file_id:
+                return conn
+            conn.really_close()
+        return self._configure_new_connection()
+
+    def _configure_new_connection(self) -> _PooledConnection:
+        """Open a connection and run the one-time pragmas.
+
+        Pragmas run only here, when the connection is created; checking a
+        connection out of the pool never re-runs them.
+        """
+        conn = sqlite3.connect(
+            self.db_path,
+            detect_types=sqlite3.PARSE_DECLTYPES,
+            factory=_PooledConnection,
+            check_same_thread=False,
+            cached_statements=256,
+        )
+        conn.db_path = self.db_path
+        conn.db_file_id = self._db_file_id()
+        conn.executescript(_CONNECTION_PRAGMAS)
+        return conn
+
+    @classmethod
+    def _release_connection(cls, conn: _PooledConnection) -> None:
+        """Return a connection to the pool, discarding it if the pool is full."""
+        if conn.in_transaction:
+            conn.rollback()
+        with cls._pool_lock:
+            idle = cls._pool.setdefault(conn.db_path, queue.LifoQueue(cls._pool_size))
+        try:
+            idle.put_nowait(conn)
+        except queue.Full:
+            conn.really_close()
+
+    @classmethod
+    def close_pool(cls) -> None:
+        """Close every idle pooled connection, for all database files.
+
+        Called on application shutdown so WAL checkpoints run and file
+        handles are released. Safe to call more than once.
+        """
+        with cls._pool_lock:
+            pools = list(cls._pool.values())
+            cls._pool.clear()
+        for idle in pools:
+            while True:
+                try:
+                    idle.get_nowait().really_close()
+                except queue.Empty:
+                    break
+
+    @contextlib.contextmanager
+    def checkout(self, as_dict=False) -> "Iterator[sqlite3.Connection]":
+        """Check out a pooled connection and return it to the pool on exit."""
+        conn = self.get_db_connection(as_dict=as_dict)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
     def get_db_connection(self, as_dict=False) -> sqlite3.Connection:
-        """Get connection to the SQLite database. Create DB if it doesn't exist."""
-        conn = sqlite3.connect(self.db_path, detect_types=sqlite3.PARSE_DECLTYPES)
+        """Get connection to the SQLite database. Create DB if it doesn't exist.
+
+        Returns the shared connection if the DBase is being used as a context
+        manager, otherwise checks a connection out of the pool. Calling
+        close() on the returned connection releases it back to the pool.
+        """
+        if self._conn is not None:
+            conn = self._conn
+        else:
+            conn = self._checkout_connection()
         if as_dict:
             conn.row_factory = dict_factory
         else:
             conn.row_factory = sqlite3.Row
+        return conn
+
+    def get_write_connection(self) -> sqlite3.Connection:
+        """Get a plain, unpooled connection for bulk write paths.
+
+        Declared-type detection is disabled because bulk loads issue no
+        SELECTs, so the per-column converter machinery never needs to run.
+        Callers close this connection for real.
+        """
+        conn = sqlite3.connect(self.db_path, detect_types=0)
         conn.execute("PRAGMA foreign_keys = ON;")
         return conn
 
@@ -115,7 +304,9 @@ class DBase:
             conn.execute(students.Student.table_def)
             conn.execute(surveys.Survey.table_def)
             conn.execute(surveys.Answer.table_def)
+            conn.execute(surveys.Answer.survey_student_index_def)
             conn.execute(events_checkins.Checkin.table_def)
+            conn.execute(events_checkins.Checkin.season_index_def)
             conn.execute(events_checkins.Event.table_def)
             conn.execute(students.Student.active_students_view_def)
         conn.close()
@@ -135,20 +326,65 @@ class DBase:
         db_data["surveys"] = [
             survey.to_dict() for survey in surveys.Survey.get_all(self)
         ]
-        event_data = [event.to_dict() for event in events_checkins.Event.get_all(self)]
-        excluded_columns = ["event_id", "day_of_week"]
+        # to_dict and to_export_dict emit only the exported columns, so no
+        # per-row column filtering is needed.
         db_data["events"] = [
-            {col: val for col, val in row.items() if col not in excluded_columns}
-            for row in event_data
+            event.to_dict() for event in events_checkins.Event.get_all(self)
         ]
-        checkins = [c.to_dict() for c in events_checkins.Checkin.get_all(self)]
-        excluded_columns = ["checkin_id"]
         db_data["checkins"] = [
-            {col: val for col, val in row.items() if col not in excluded_columns}
-            for row in checkins
+            c.to_export_dict() for c in events_checkins.Checkin.get_all(self)
         ]
         return db_data
 
+    def dump_json(self, json_path: pathlib.Path) -> None:
+        """Write database contents to a JSON file.
+
+        Produces the same structure as to_dict, but streams each table's
+        rows straight into the file instead of first building the whole
+        database as one dictionary plus its serialized string. Peak memory
+        is bounded by the largest single table.
+        """
+        encoder = json.JSONEncoder(indent=2)
+        tables: tuple[tuple[str, Any], ...] = (
+            (
+                "students",
+                lambda: (
+                    student.to_dict()
+                    for student in students.Student.get_all(self, include_inactive=True)
+                ),
+            ),
+            (
+                "surveys",
+                lambda: (survey.to_dict() for survey in surveys.Survey.get_all(self)),
+            ),
+            (
+                "events",
+                lambda: (
+                    event.to_dict() for event in events_checkins.Event.get_all(self)
+                ),
+            ),
+            (
+                "checkins",
+                lambda: (
+                    checkin.to_export_dict()
+                    for checkin in events_checkins.Checkin.get_all(self)
+                ),
+            ),
+        )
+        with open(json_path, "wt") as jfile:
+            jfile.write("{")
+            for table_index, (table_name, get_rows) in enumerate(tables):
+                if table_index:
+                    jfile.write(",")
+                jfile.write(f'\n"{table_name}": [')
+                for row_index, row in enumerate(get_rows()):
+                    if row_index:
+                        jfile.write(",")
+                    for chunk in encoder.iterencode(row):
+                        jfile.write(chunk)
+                jfile.write("]")
+            jfile.write("\n}")
+
     def load_from_dict(
         self, db_data_dict: dict[str, list[dict[str, str | int | None]]]
     ) -> None:
@@ -184,19 +420,86 @@ class DBase:
             for survey in db_data_dict.get("surveys", [])
         ]
 
-        with self.get_db_connection() as conn:
-            conn.executemany(student_query, db_data_dict["students"])
-            conn.executemany(survey_query, survey_data)
-            conn.executemany(event_query, db_data_dict["events"])
-        with conn:
-            conn.executemany(checkins_query, db_data_dict["checkins"])
+        # Import everything in one transaction so the load costs a single
+        # commit instead of one per table. The covering index is dropped
+        # during the load and rebuilt afterwards, which is faster than
+        # updating it row by row.
+        conn = self.get_write_connection()
+        try:
+            conn.execute("PRAGMA synchronous = OFF;")
+            conn.execute("DROP INDEX IF EXISTS idx_checkins_ts_sid_ed;")
+            with conn:
+                for query, rows in (
+                    (student_query, db_data_dict["students"]),
+                    (survey_query, survey_data),
+                    (event_query, db_data_dict["events"]),
+                    (checkins_query, db_data_dict["checkins"]),
+                ):
+                    # Batch inserts to bound memory on very large imports.
+                    for start in range(0, len(rows), self._import_batch_size):
+                        conn.executemany(
+                            query, rows[start : start + self._import_batch_size]
+                        )
+            conn.execute(events_checkins.Checkin.season_index_def)
+            # Refresh planner statistics so the bulk-loaded data uses the indexes.
+            conn.execute("ANALYZE;")
+        finally:
+            conn.execute("PRAGMA synchronous = NORMAL;")
+            conn.close()
+        surveys.clear_survey_caches()
+
+    def get_report_aggregates(self) -> dict[str, dict[str, Any]]:
+        """Get all summary-report aggregates with a single query.
+
+        Returns:
+            Dictionary with "students", "events", and "checkins" keys, each
+            holding the same totals as the corresponding summary()
+            classmethod.
+        """
+        query = """
+            SELECT (SELECT COUNT(*) FROM students) AS total_students,
+                   (SELECT COUNT(deactivated_on) FROM students) AS deactivated,
+                   (SELECT COUNT(*) FROM events) AS total_events,
+                   (SELECT MIN(event_date) FROM events) AS earliest_event,
+                   (SELECT MAX(event_date) FROM events) AS latest_event,
+                   (SELECT COUNT(*) FROM checkins) AS total_checkins,
+                   (SELECT MIN(timestamp) FROM checkins) AS earliest_checkin,
+                   (SELECT MAX(timestamp) FROM checkins) AS latest_checkin;
+        """
+        conn = self.get_db_connection()
+        row = conn.execute(query).fetchone()
         conn.close()
+        return {
+            "students": {
+                "total": row["total_students"],
+                "active": row["total_students"] - row["deactivated"],
+                "deactivated": row["deactivated"],
+            },
+            "events": {
+                "total": row["total_events"],
+                "earliest": row["earliest_event"],
+                "latest": row["latest_event"],
+            },
+            "checkins": {
+                "total": row["total_checkins"],
+                "earliest": row["earliest_checkin"],
+                "latest": row["latest_checkin"],
+            },
+        }
 
     def get_database_file_info(self) -> DbInfo:
-        """Get information about the currently-selected database file."""
+        """Get information about the currently-selected database file.
+
+        The DbInfo is rebuilt only when the file's modification time has
+        changed since the previous call.
+        """
         file_info = os.stat(self.db_path)
-        return DbInfo(
+        if self._stat_cache is not None and self._stat_cache[0] == file_info.st_mtime_ns:
+            return self._stat_cache[1]
+        db_info = DbInfo(
             access_time=datetime.datetime.fromtimestamp(file_info.st_atime),
             modification_time=datetime.datetime.fromtimestamp(file_info.st_mtime),
             creation_time=datetime.datetime.fromtimestamp(file_info.st_birthtime),
         )
+        self._stat_cache = (file_info.st_mtime_ns, db_info)
+        return db_info
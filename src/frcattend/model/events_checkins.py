@@ -343,6 +343,11 @@ class Checkin:
             CONSTRAINT single_event_constraint UNIQUE(student_id, event_date, event_type)
         );
     """
+    season_index_def: ClassVar[str] = """
+        CREATE INDEX IF NOT EXISTS idx_checkins_ts_sid_ed
+            ON checkins (timestamp, student_id, event_date);
+    """
+    """Covering index for the season aggregates in the attendance queries."""
     # DEFERRABLE INITIALLY DEFERRED allows queries to create foreign key violations
     # within a transaction, as long as the violations are fixed before the end of the
     # transaction. See section 4.2 of https://sqlite.org/foreignkeys.html
@@ -416,6 +421,38 @@ class Checkin:
         self.checkin_id = 0 if checkin_id is None else checkin_id
         return self.checkin_id
 
+    @classmethod
+    def add_many(cls, dbase: "database.DBase", checkins: list["Checkin"]) -> int:
+        """Add several checkin records in a single transaction.
+
+        One commit for the whole batch instead of a commit (and fsync)
+        per checkin, which matters during scanning bursts.
+
+        Returns:
+            The number of records inserted.
+        """
+        query = """
+                INSERT INTO checkins
+                            (student_id, event_type, timestamp, inactive)
+                     VALUES (?, ?, ?, ?);
+        """
+        with dbase.get_db_connection() as conn:
+            cursor = conn.executemany(
+                query,
+                [
+                    (
+                        checkin.student_id,
+                        checkin.event_type.value,
+                        checkin.timestamp,
+                        checkin.inactive,
+                    )
+                    for checkin in checkins
+                ],
+            )
+            count = cursor.rowcount
+        conn.close()
+        return count
+
     @staticmethod
     def get_all(dbase: "database.DBase") -> list["Checkin"]:
         """Retrieve a list of Checkin objects from the database."""
@@ -450,6 +487,31 @@ class Checkin:
         conn.close()
         return student_ids
 
+    @classmethod
+    def get_checkedin_student_set(
+        cls,
+        dbase: "database.DBase",
+        event_date: datetime.date,
+        event_type: EventType,
+    ) -> set[str]:
+        """Get the set of student IDs who checked in for a given event.
+
+        Dedup happens in SQL and rows stream straight into the set, so
+        callers that need membership tests skip the intermediate list.
+        """
+        query = """
+                SELECT DISTINCT student_id
+                  FROM checkins
+                 WHERE event_date = ?
+                   AND event_type = ?;
+        """
+        conn = dbase.get_db_connection()
+        student_ids = {
+            row["student_id"] for row in conn.execute(query, (event_date, event_type))
+        }
+        conn.close()
+        return student_ids
+
     @classmethod
     def get_checkins_by_student(
         cls, dbase: "database.DBase", student_id: str
@@ -466,6 +528,27 @@ class Checkin:
         conn.close()
         return checkins
 
+    @classmethod
+    def get_all_by_student(
+        cls, dbase: "database.DBase"
+    ) -> dict[str, list["Checkin"]]:
+        """Get every student's checkins in one query, grouped by student ID.
+
+        One round-trip replaces a per-student query when a view needs
+        checkin history for many students in turn.
+        """
+        query = """
+                SELECT checkin_id, student_id, event_type, timestamp, inactive
+                  FROM checkins
+              ORDER BY student_id, event_date;
+        """
+        conn = dbase.get_db_connection(as_dict=True)
+        checkins: dict[str, list[Checkin]] = {}
+        for row in conn.execute(query):
+            checkins.setdefault(row["student_id"], []).append(Checkin(**row))
+        conn.close()
+        return checkins
+
     @staticmethod
     def get_counts_by_student(
         dbase: "database.DBase", since: datetime.date
@@ -528,16 +611,19 @@ class Checkin:
         conn.close()
         return checkins
 
-    def to_dict(self) -> dict:
-        """Convert the Checkin dataclass to a JSON-serializable dictionary."""
+    def to_export_dict(self) -> dict:
+        """Checkin as a dictionary without the database-assigned checkin_id."""
         return {
-            "checkin_id": self.checkin_id,
             "student_id": self.student_id,
             "event_type": self.event_type,
             "timestamp": self.timestamp.isoformat(),
             "inactive": self.inactive,
         }
 
+    def to_dict(self) -> dict:
+        """Convert the Checkin dataclass to a JSON-serializable dictionary."""
+        return {"checkin_id": self.checkin_id, **self.to_export_dict()}
+
     @staticmethod
     def summary(dbase: "database.DBase") -> dict[str, Any]:
         """Get a summary of checkins in database."""
@@ -10,7 +10,7 @@ if TYPE_CHECKING:
     from frcattend.model import database
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Student:
     """An FRC student."""
 
@@ -186,9 +186,10 @@ class Student:
         dbase: "database.DBase", include_inactive: bool = False
     ) -> list[str]:
         """Retrieve a list of all student IDs from the database."""
-        query = """
+        table_name = "students" if include_inactive else "active_students"
+        query = f"""
                 SELECT student_id
-                  FROM students
+                  FROM {table_name}
               ORDER BY student_id;
         """
         conn = dbase.get_db_connection()
@@ -1,35 +1,227 @@
-"""Surveys present a qustion to students when they checkin."""
+"""Surveys present a qustion to students when they checkin.
+
+Survey and Answer are constructed once per row when loading query results,
+so their __init__ and to_dict methods are kept deliberately lean: plain
+__slots__ classes, hand-written dict literals, and orjson for the choices column
+when available. Compiling them to a C extension was considered and
+rejected — frcattend ships as a pure-Python package and the row counts
+involved (hundreds of surveys/answers) don't justify a compiled build
+step.
+"""
 
-import dataclasses
 import datetime
+import functools
 import json
+import sqlite3
 from typing import Any, ClassVar, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from frcattend.model import database
 
+# The choices columns are (de)serialized on every survey and answer row, so
+# use orjson's C implementation when it is installed. Both loaders raise a
+# subclass of ValueError on invalid JSON.
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+
+
+# SQL statements are defined once at module scope so every call passes the
+# same string object to execute and hits sqlite3's per-connection statement
+# cache. Connections themselves are pooled by DBase, so prepared statements
+# survive across calls.
+_SQL_ADD_SURVEY = """
+        INSERT INTO surveys
+                    (title, question, choices, multiselect,
+                    allow_freetext, max_length, replace)
+             VALUES (?, ?, ?, ?, ?, ?, ?);
+"""
+
+_SQL_UPDATE_SURVEY = """
+        UPDATE surveys
+           SET question = ?,
+               choices = ?,
+               multiselect = ?,
+               allow_freetext = ?,
+               max_length = ?,
+               replace = ?
+         WHERE title = ?;
+"""
+
+_SQL_UPSERT_SURVEY = """
+        INSERT INTO surveys
+                    (title, question, choices, multiselect,
+                    allow_freetext, max_length, replace)
+             VALUES (?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT (title)
+        DO UPDATE SET question = excluded.question,
+                      choices = excluded.choices,
+                      multiselect = excluded.multiselect,
+                      allow_freetext = excluded.allow_freetext,
+                      max_length = excluded.max_length,
+                      replace = excluded.replace;
+"""
+
+_SQL_DELETE_SURVEY = """
+        DELETE FROM surveys
+              WHERE title = ?;
+"""
+
+_SQL_GET_SURVEY_BY_TITLE = """
+        SELECT title, question, choices, multiselect,
+               allow_freetext, max_length, replace
+          FROM surveys
+         WHERE title = :title;
+"""
+
+_SQL_GET_ALL_SURVEYS = """
+        SELECT title, question, choices, multiselect,
+               allow_freetext, max_length, replace
+          FROM surveys
+      ORDER BY title;
+"""
+
+# Moves a prior answer to the new date. Affects no rows when the student
+# has no prior answers or already answered on this date.
+_SQL_MOVE_ANSWER = """
+        UPDATE answers
+           SET answer_date = :answer_date,
+               choices = :choices_json,
+               freetext_answer = :freetext_answer
+         WHERE survey_title = :survey_title
+           AND student_id = :student_id
+           AND NOT EXISTS (
+               SELECT 1
+                 FROM answers
+                WHERE survey_title = :survey_title
+                  AND student_id = :student_id
+                  AND answer_date = :answer_date
+               );
+"""
+
+_SQL_UPSERT_ANSWER = """
+        INSERT INTO answers
+                    (student_id, survey_title, answer_date,
+                    choices, freetext_answer)
+            VALUES (:student_id, :survey_title, :answer_date,
+                    :choices_json, :freetext_answer)
+        ON CONFLICT (student_id, survey_title, answer_date)
+        DO UPDATE SET choices = excluded.choices,
+                      freetext_answer = excluded.freetext_answer;
+"""
+
+_SQL_INSERT_ANSWER = """
+        INSERT INTO answers
+                    (student_id, survey_title, answer_date,
+                    choices, freetext_answer)
+            VALUES (:student_id, :survey_title, :answer_date,
+                    :choices_json, :freetext_answer);
+"""
+
+_SQL_UPDATE_ANSWER_BY_SURVEY_AND_STUDENT = """
+        UPDATE answers
+           SET answer_date = :answer_date,
+               choices = :choices_json,
+               freetext_answer = :freetext_answer
+         WHERE survey_title = :survey_title AND
+               student_id = :student_id;
+"""
+
+_SQL_UPDATE_ANSWER = """
+        UPDATE answers
+           SET choices = :choices_json,
+               freetext_answer = :freetext_answer
+         WHERE student_id = :student_id
+           AND survey_title = :survey_title
+           AND answer_date = :answer_date;
+"""
+
+_SQL_GET_ALL_ANSWERS = """
+        SELECT student_id, survey_title, answer_date,
+               choices, freetext_answer
+          FROM answers
+      ORDER BY survey_title, student_id, answer_date DESC;
+"""
+
+_SQL_GET_ANSWERS_BY_TITLE_AND_STUDENT = """
+        SELECT student_id, survey_title, answer_date,
+               choices, freetext_answer
+          FROM answers
+         WHERE survey_title = :survey_title
+           AND student_id = :student_id
+      ORDER BY answer_date DESC;
+"""
+
+
+CACHE_ENABLED = True
+"""Serve Survey lookups from an in-process cache after the first read.
+
+Surveys rarely change during a session, but every screen mount re-reads
+them. Writes through Survey methods invalidate the cache; set to False if
+another process may modify the surveys table while the app is running.
+"""
+
+_survey_cache: dict[tuple[str, str], "Survey"] = {}
+"""get_by_title results keyed by (database path, title)."""
+_all_surveys_cache: dict[str, list["Survey"]] = {}
+"""get_all results keyed by database path."""
+
+
+def clear_survey_caches() -> None:
+    """Drop all cached surveys; called after any surveys-table write."""
+    _survey_cache.clear()
+    _all_surveys_cache.clear()
+
+
+@functools.lru_cache(maxsize=256)
+def _dumps_choices(choices: tuple[str, ...]) -> str:
+    """Encode a choices tuple as a JSON array string.
+
+    Bulk checkins produce many answers with identical choices; memoizing
+    the encoded form turns N dumps calls into one per distinct answer set.
+    """
+    return _json_dumps(list(choices))
+
 
 class SurveyError(Exception):
     """Error related to surveys and answers."""
 
 
-@dataclasses.dataclass
 class Survey:
     """A question and a set of choices."""
 
+    __slots__ = (
+        "title",
+        "question",
+        "choices",
+        "multiselect",
+        "allow_freetext",
+        "max_length",
+        "replace",
+        "_choices_cache",
+        "_choices_text_cache",
+    )
+
     title: str
     """Short, unique (a few words) title that identifies the survey."""
     question: str
     """Question that is presented to students who are taking the survey."""
     choices: list[str]
     """Possible answers displayed in the multiple-choice section of the survey. """
-    multiselect: bool = False
+    multiselect: bool
     """True if students can selected more than one choice."""
-    allow_freetext: bool = False
+    allow_freetext: bool
     """Students are allowed to type their answer into an input box if True."""
-    max_length: int | None = None
+    max_length: int | None
     """Max length in characters of freetext answer. None if not allow_freetext."""
-    replace: bool = True
+    replace: bool
     """If True, older answers are always replaced by the most recent answer.
     
     For some surveys, if they are given every year, we'll want to retain
@@ -41,6 +233,10 @@ class Survey:
     student to change their answer if they realized they initially gave an
     incorrect answer.
     """
+    _choices_cache: Optional[tuple[list[str], str]]
+    """Cached (choices list, JSON string) pair. See choices_json."""
+    _choices_text_cache: Optional[tuple[list[str], str]]
+    """Cached (choices list, newline-joined text) pair. See choices_text."""
 
     table_def: ClassVar[str] = """
         CREATE TABLE IF NOT EXISTS surveys (
@@ -68,113 +264,241 @@ class Survey:
         self.title = title
         self.question = question
         if isinstance(choices, str):
-            self.choices = json.loads(choices)
+            self.choices = _json_loads(choices)
+            # Rows loaded from the database already carry the JSON form.
+            self._choices_cache = (self.choices, choices)
         else:
             self.choices = choices
+            self._choices_cache = None
         self.multiselect = multiselect
         self.allow_freetext = allow_freetext
         self.max_length = max_length
         self.replace = replace
+        self._choices_text_cache = None
 
     @property
     def choices_json(self) -> str:
-        """Convert survey options list to a string containing a JSON array."""
-        return json.dumps(self.choices)
+        """Convert survey options list to a string containing a JSON array.
+
+        The encoded string is cached against the identity of the choices
+        list, so repeated reads don't re-serialize and assigning a new list
+        to choices invalidates the cache.
+        """
+        if self._choices_cache is None or self._choices_cache[0] is not self.choices:
+            self._choices_cache = (self.choices, _dumps_choices(tuple(self.choices)))
+        return self._choices_cache[1]
+
+    @property
+    def choices_text(self) -> str:
+        """Survey choices joined with newlines, one choice per line.
+
+        Cached the same way as choices_json, so repeated edit-dialog opens
+        for the same survey skip the join.
+        """
+        if (
+            self._choices_text_cache is None
+            or self._choices_text_cache[0] is not self.choices
+        ):
+            self._choices_text_cache = (self.choices, "\n".join(self.choices))
+        return self._choices_text_cache[1]
 
     def to_dict(self) -> dict[str, Any]:
-        """Convert survey to a dictionary."""
-        return dataclasses.asdict(self)
+        """Convert survey to a dictionary.
+
+        Built by hand instead of dataclasses.asdict, which deep-copies the
+        choices list on every call.
+        """
+        return {
+            "title": self.title,
+            "question": self.question,
+            "choices": self.choices,
+            "multiselect": self.multiselect,
+            "allow_freetext": self.allow_freetext,
+            "max_length": self.max_length,
+            "replace": self.replace,
+        }
+
+    def _insert_params(self) -> tuple:
+        """Positional parameters for the INSERT/UPSERT statements.
+
+        Positional binding skips the parameter-dict build and per-key
+        lookup that named binding costs on every write.
+        """
+        return (
+            self.title,
+            self.question,
+            self.choices_json,
+            self.multiselect,
+            self.allow_freetext,
+            self.max_length,
+            self.replace,
+        )
 
     def add(self, dbase: "database.DBase") -> bool:
         """Add a survey to the database."""
-        query = """
-                INSERT INTO surveys
-                            (title, question, choices, multiselect,
-                            allow_freetext, max_length, replace)
-                     VALUES (:title, :question, :choices_json, :multiselect,
-                            :allow_freetext, :max_length, :replace);
-        """
         with dbase.get_db_connection() as conn:
-            cursor = conn.execute(
-                query, {**self.to_dict(), "choices_json": self.choices_json}
-            )
+            cursor = conn.execute(_SQL_ADD_SURVEY, self._insert_params())
         rowcount = cursor.rowcount
         conn.close()
+        clear_survey_caches()
         return rowcount == 1
 
     def update(self, dbase: "database.DBase") -> bool:
         """Update the survey in the database."""
-        query = """
-                UPDATE surveys
-                   SET question = :question,
-                       choices = :choices_json,
-                       multiselect = :multiselect,
-                       allow_freetext = :allow_freetext,
-                       max_length = :max_length,
-                       replace = :replace
-                 WHERE title = :title;
-        """
         with dbase.get_db_connection() as conn:
             cursor = conn.execute(
-                query, {**self.to_dict(), "choices_json": self.choices_json}
+                _SQL_UPDATE_SURVEY,
+                (
+                    self.question,
+                    self.choices_json,
+                    self.multiselect,
+                    self.allow_freetext,
+                    self.max_length,
+                    self.replace,
+                    self.title,
+                ),
             )
         rowcount = cursor.rowcount
         conn.close()
+        clear_survey_caches()
+        return rowcount == 1
+
+    @classmethod
+    def add_many(cls, dbase: "database.DBase", surveys: "list[Survey]") -> int:
+        """Add several surveys to the database in one transaction.
+
+        One executemany against the cached INSERT statement, so a bulk
+        import pays for a single parse and a single commit.
+
+        Returns:
+            The number of surveys added.
+        """
+        if not surveys:
+            return 0
+        params = [survey._insert_params() for survey in surveys]
+        conn = dbase.get_db_connection()
+        try:
+            with conn:
+                conn.executemany(_SQL_ADD_SURVEY, params)
+        finally:
+            conn.close()
+        clear_survey_caches()
+        return len(params)
+
+    def upsert(self, dbase: "database.DBase") -> bool:
+        """Add the survey, or update it if the title already exists.
+
+        Lets callers skip the lookup that decides between add and update;
+        SQLite resolves the conflict on title in a single statement.
+        """
+        with dbase.get_db_connection() as conn:
+            cursor = conn.execute(_SQL_UPSERT_SURVEY, self._insert_params())
+        rowcount = cursor.rowcount
+        conn.close()
+        clear_survey_caches()
         return rowcount == 1
 
     @staticmethod
     def delete_by_title(dbase: "database.DBase", title: str) -> bool:
         """Delete the survey's database record."""
-        query = """
-                DELETE FROM surveys
-                      WHERE title = :title;
-        """
         with dbase.get_db_connection() as conn:
-            cursor = conn.execute(query, {"title": title})
+            cursor = conn.execute(_SQL_DELETE_SURVEY, (title,))
         rowcount = cursor.rowcount
         conn.close()
+        clear_survey_caches()
         return rowcount == 1
 
+    @classmethod
+    def _from_row(
+        cls,
+        title: str,
+        question: str,
+        choices: str,
+        multiselect: bool,
+        allow_freetext: bool,
+        max_length: Optional[int],
+        replace: bool,
+    ) -> "Survey":
+        """Build a Survey from a database row, positionally.
+
+        Skips the keyword binding and string/list dispatch in __init__;
+        rows always deliver choices as JSON text.
+        """
+        survey = cls.__new__(cls)
+        survey.title = title
+        survey.question = question
+        survey.choices = _json_loads(choices)
+        survey._choices_cache = (survey.choices, choices)
+        survey.multiselect = multiselect
+        survey.allow_freetext = allow_freetext
+        survey.max_length = max_length
+        survey.replace = replace
+        return survey
+
     @staticmethod
     def get_by_title(dbase: "database.DBase", title: str) -> "Survey | None":
         """Get the survey with the givent title, or None if it doesn't exist."""
-        query = """
-                SELECT title, question, choices, multiselect,
-                       allow_freetext, max_length, replace
-                  FROM surveys
-                 WHERE title = :title;
-        """
-        conn = dbase.get_db_connection(as_dict=True)
-        result = conn.execute(query, {"title": title}).fetchone()
+        cache_key = (str(dbase.db_path), title)
+        if CACHE_ENABLED and cache_key in _survey_cache:
+            return _survey_cache[cache_key]
+        conn = dbase.get_db_connection()
+        result = conn.execute(_SQL_GET_SURVEY_BY_TITLE, {"title": title}).fetchone()
         conn.close()
         if result:
-            return Survey(**result)
+            survey = Survey._from_row(*result)
+            if CACHE_ENABLED:
+                _survey_cache[cache_key] = survey
+            return survey
         return None
 
+    @staticmethod
+    def _row_factory(cursor, row: tuple) -> "Survey":
+        """sqlite3 row factory that builds Survey objects with no Row step."""
+        return Survey._from_row(*row)
+
     @staticmethod
     def get_all(dbase: "database.DBase") -> list["Survey"]:
         """Retrive all surveys from the database."""
-        query = """
-                SELECT title, question, choices, multiselect,
-                       allow_freetext, max_length, replace
-                  FROM surveys
-              ORDER BY title;
-        """
-        conn = dbase.get_db_connection(as_dict=True)
-        surveys = [Survey(**survey) for survey in conn.execute(query)]
+        cache_key = str(dbase.db_path)
+        if CACHE_ENABLED and cache_key in _all_surveys_cache:
+            # Shallow copy so callers can sort or filter their list.
+            return list(_all_surveys_cache[cache_key])
+        conn = dbase.get_db_connection()
+        conn.row_factory = Survey._row_factory
+        surveys = list(conn.execute(_SQL_GET_ALL_SURVEYS))
         conn.close()
+        if CACHE_ENABLED:
+            _all_surveys_cache[cache_key] = list(surveys)
         return surveys
 
+    @staticmethod
+    def count(dbase: "database.DBase") -> int:
+        """Get the number of surveys without materializing them."""
+        conn = dbase.get_db_connection()
+        result = conn.execute("SELECT COUNT(*) FROM surveys;").fetchone()[0]
+        conn.close()
+        return result
+
 
-@dataclasses.dataclass
 class Answer:
     """An answer to a survey question."""
 
+    __slots__ = (
+        "student_id",
+        "survey_title",
+        "answer_date",
+        "choices",
+        "freetext_answer",
+        "_choices_cache",
+    )
+
     student_id: str
     survey_title: str
     answer_date: datetime.date
     choices: list[str]
-    freetext_answer: str | None = None
+    freetext_answer: str | None
+    _choices_cache: Optional[tuple[list[str], str]]
+    """Cached (choices list, JSON string) pair. See choices_json."""
 
     table_def: ClassVar[str] = """
         CREATE TABLE IF NOT EXISTS answers (
@@ -187,6 +511,12 @@ class Answer:
             FOREIGN KEY (survey_title) REFERENCES surveys (title)
         );
     """
+    survey_student_index_def: ClassVar[str] = """
+        CREATE INDEX IF NOT EXISTS idx_answers_survey_student_date
+            ON answers (survey_title, student_id, answer_date DESC);
+    """
+    """Covering index for get_by_title_and_student and the Answer.add
+    subquery; also serves the ORDER BY answer_date DESC without a sort."""
 
     def __init__(
         self,
@@ -199,94 +529,227 @@ class Answer:
         """Convert fields from Sqlite to Python datatypes as needed."""
         self.student_id = student_id
         self.survey_title = survey_title
-        match answer_date:
-            case None:
-                self.answer_date = datetime.date.today()
-            case str():
-                self.answer_date = datetime.datetime.fromisoformat(answer_date).date()
-            case datetime.date():
-                self.answer_date = answer_date
-            case _:
-                raise SurveyError(
-                    "Invalid answer_date argument. "
-                    "Must be None, datetime.date, or ISO date as string."
-                )
+        # Plain branches beat match/case here: this runs once per loaded
+        # row, and date.fromisoformat skips the intermediate datetime.
+        if answer_date is None:
+            self.answer_date = datetime.date.today()
+        elif type(answer_date) is str:
+            self.answer_date = datetime.date.fromisoformat(answer_date)
+        elif isinstance(answer_date, datetime.date):
+            self.answer_date = answer_date
+        else:
+            raise SurveyError(
+                "Invalid answer_date argument. "
+                "Must be None, datetime.date, or ISO date as string."
+            )
+        self._choices_cache = None
         if isinstance(choices, str):
-            try:
-                self.choices = json.loads(choices)
-                if not isinstance(self.choices, list):
-                    self.choices = [choices]
-            except json.JSONDecodeError:
-                self.choices = [choices]
+            self.choices = self._parse_choices(choices)
         else:
             self.choices = choices
         self.freetext_answer = freetext_answer
 
+    def __eq__(self, other: object) -> bool:
+        """Compare answers field by field, ignoring the internal cache."""
+        if not isinstance(other, Answer):
+            return NotImplemented
+        return (
+            self.student_id == other.student_id
+            and self.survey_title == other.survey_title
+            and self.answer_date == other.answer_date
+            and self.choices == other.choices
+            and self.freetext_answer == other.freetext_answer
+        )
+
+    def __repr__(self) -> str:
+        """Dataclass-style repr, mainly for readable test failures."""
+        return (
+            f"Answer({self.student_id!r}, {self.survey_title!r}, "
+            f"{self.choices!r}, {self.answer_date!r}, {self.freetext_answer!r})"
+        )
+
+    def _parse_choices(self, choices: str) -> list[str]:
+        """Convert a stored choices string to a list of selected choices.
+
+        Only text starting with "[" can be a stored JSON choice list, so
+        anything else is treated as a bare freetext value without paying
+        for a raised-and-caught decode exception.
+        """
+        if choices.startswith("["):
+            try:
+                parsed = _json_loads(choices)
+            except ValueError:
+                parsed = None
+            if isinstance(parsed, list):
+                # Rows loaded from the database already carry the JSON form.
+                self._choices_cache = (parsed, choices)
+                return parsed
+        return [choices]
+
     @property
     def choices_json(self) -> str:
-        """Selected answers as a JSON string."""
-        return json.dumps(self.choices)
+        """Selected answers as a JSON string.
+
+        Cached against the identity of the choices list; assigning a new
+        list to choices invalidates the cache.
+        """
+        if self._choices_cache is None or self._choices_cache[0] is not self.choices:
+            self._choices_cache = (self.choices, _dumps_choices(tuple(self.choices)))
+        return self._choices_cache[1]
 
     def to_dict(self) -> dict[str, Any]:
-        """Convert answer object to a dictionary."""
-        return {**dataclasses.asdict(self), "choices_json": self.choices_json}
+        """Convert answer object to a dictionary.
+
+        Built by hand instead of dataclasses.asdict, which deep-copies the
+        choices list, and with choices_json inlined so queries get their
+        parameters from a single dict build.
+        """
+        return {
+            "student_id": self.student_id,
+            "survey_title": self.survey_title,
+            "answer_date": self.answer_date,
+            "choices": self.choices,
+            "freetext_answer": self.freetext_answer,
+            "choices_json": self.choices_json,
+        }
 
     def add(self, dbase: "database.DBase", replace: bool = True) -> bool:
-        """Add an answer to the answers table."""
-        prior_answers = self.get_by_title_and_student(
-            dbase, self.survey_title, self.student_id
-        )
-        prior_dates = set(answer.answer_date for answer in prior_answers)
-        if len(prior_answers) == 0 or self.answer_date in prior_dates or not replace:
-            query = """
-                    INSERT INTO answers
-                                (student_id, survey_title, answer_date,
-                                choices, freetext_answer)
-                        VALUES (:student_id, :survey_title, :answer_date,
-                                :choices_json, :freetext_answer);
-            """
-        else:
-            query = """
-                    UPDATE answers
-                       SET answer_date = :answer_date,
-                           choices = :choices_json,
-                           freetext_answer = :freetext_answer
-                     WHERE survey_title = :survey_title AND
-                           student_id = :student_id;
-            """
+        """Add an answer to the answers table.
+
+        An answer on the same date is always replaced. With replace=True, an
+        answer from an earlier date is moved to this answer's date instead
+        of being retained as history. The decision is made in SQL, so no
+        prior-answer rows are fetched or constructed.
+        """
+        params = self.to_dict()
+        rowcount = 0
         with dbase.get_db_connection() as conn:
-            cursor = conn.execute(query, self.to_dict())
-        rowcount = cursor.rowcount
+            if replace:
+                rowcount = conn.execute(_SQL_MOVE_ANSWER, params).rowcount
+            if rowcount == 0:
+                rowcount = conn.execute(_SQL_UPSERT_ANSWER, params).rowcount
         conn.close()
         return rowcount == 1
 
+    @classmethod
+    def add_many(
+        cls, dbase: "database.DBase", answers: "list[Answer]", replace: bool = True
+    ) -> int:
+        """Add several answers to the answers table in one transaction.
+
+        Applies the same replace logic as add, but with a single SELECT for
+        all prior answers and batched INSERT/UPDATE statements, so a bulk
+        checkin costs one commit instead of one per answer.
+
+        Returns:
+            The number of answers written to the database.
+        """
+        if not answers:
+            return 0
+        pairs = {(answer.survey_title, answer.student_id) for answer in answers}
+        prior_query = f"""
+                SELECT survey_title, student_id, answer_date
+                  FROM answers
+                 WHERE (survey_title, student_id) IN
+                       (VALUES {", ".join(["(?, ?)"] * len(pairs))});
+        """
+        conn = dbase.get_db_connection()
+        try:
+            prior_params = [value for pair in pairs for value in pair]
+            prior_dates: dict[tuple[str, str], set[datetime.date]] = {}
+            for row in conn.execute(prior_query, prior_params):
+                key = (row["survey_title"], row["student_id"])
+                prior_dates.setdefault(key, set()).add(row["answer_date"])
+            inserts = []
+            updates = []
+            for answer in answers:
+                dates = prior_dates.get((answer.survey_title, answer.student_id))
+                if not dates or answer.answer_date in dates or not replace:
+                    inserts.append(answer.to_dict())
+                else:
+                    updates.append(answer.to_dict())
+            with conn:
+                if inserts:
+                    conn.executemany(_SQL_INSERT_ANSWER, inserts)
+                if updates:
+                    conn.executemany(_SQL_UPDATE_ANSWER_BY_SURVEY_AND_STUDENT, updates)
+        finally:
+            conn.close()
+        return len(inserts) + len(updates)
+
     def update(self, dbase: "database.DBase") -> bool:
         """Update the answer in the database."""
-        query = """
-                UPDATE answers
-                   SET choices = :choices_json,
-                       freetext_answer = :freetext_answer
-                 WHERE student_id = :student_id
-                   AND survey_title = :survey_title
-                   AND answer_date = :answer_date;
-        """
         with dbase.get_db_connection() as conn:
-            cursor = conn.execute(query, self.to_dict())
+            cursor = conn.execute(_SQL_UPDATE_ANSWER, self.to_dict())
         rowcount = cursor.rowcount
         conn.close()
         return rowcount == 1
 
+    @classmethod
+    def _from_row(
+        cls,
+        student_id: str,
+        survey_title: str,
+        answer_date: datetime.date,
+        choices: str,
+        freetext_answer: str | None,
+    ) -> "Answer":
+        """Build an Answer from a database row, positionally.
+
+        Skips keyword binding and the answer_date dispatch in __init__; the
+        DATE converter already delivers a datetime.date.
+        """
+        answer = cls.__new__(cls)
+        answer.student_id = student_id
+        answer.survey_title = survey_title
+        answer.answer_date = answer_date
+        answer._choices_cache = None
+        answer.choices = answer._parse_choices(choices)
+        answer.freetext_answer = freetext_answer
+        return answer
+
+    @staticmethod
+    def _row_factory(cursor, row: tuple) -> "Answer":
+        """sqlite3 row factory that builds Answer objects with no Row step."""
+        return Answer._from_row(*row)
+
     @staticmethod
     def get_all(dbase: "database.DBase") -> list["Answer"]:
         """Retrive all answers from the database."""
-        query = """
-                SELECT student_id, survey_title, answer_date,
-                       choices, freetext_answer
-                  FROM answers
-              ORDER BY survey_title, student_id, answer_date DESC;
+        conn = dbase.get_db_connection()
+        conn.row_factory = Answer._row_factory
+        answers = list(conn.execute(_SQL_GET_ALL_ANSWERS))
+        conn.close()
+        return answers
+
+    @staticmethod
+    def get_all_columns(dbase: "database.DBase") -> dict[str, list]:
+        """Retrive all answers as a dict of columns.
+
+        Aggregations that walk one field over thousands of answers (counts
+        per choice, students who answered X) iterate a single list instead
+        of pulling attributes from per-row objects. The choices column
+        holds the stored JSON text; decode entries only as needed.
+        """
+        conn = dbase.get_db_connection()
+        conn.row_factory = None
+        rows = conn.execute(_SQL_GET_ALL_ANSWERS).fetchall()
+        conn.close()
+        names = ("student_id", "survey_title", "answer_date", "choices",
+                 "freetext_answer")
+        if rows:
+            return dict(zip(names, map(list, zip(*rows))))
+        return {name: [] for name in names}
+
+    @staticmethod
+    def get_all_lazy(dbase: "database.DBase") -> list["LazyAnswer"]:
+        """Retrive all answers as read-only LazyAnswer views.
+
+        Cheaper than get_all for callers that scan answer metadata without
+        reading the selected choices, since no JSON is decoded up front.
         """
-        conn = dbase.get_db_connection(as_dict=True)
-        answers = [Answer(**answer) for answer in conn.execute(query)]
+        conn = dbase.get_db_connection()
+        answers = [LazyAnswer(row) for row in conn.execute(_SQL_GET_ALL_ANSWERS)]
         conn.close()
         return answers
 
@@ -295,18 +758,47 @@ class Answer:
         dbase: "database.DBase", survey_title: str, student_id: str
     ) -> list["Answer"]:
         """Get all answers for a specific survey and student."""
-        query = """
-                SELECT student_id, survey_title, answer_date,
-                       choices, freetext_answer
-                  FROM answers
-                 WHERE survey_title = :survey_title
-                   AND student_id = :student_id
-              ORDER BY answer_date DESC;
-        """
-        conn = dbase.get_db_connection(as_dict=True)
-        cursor = conn.execute(
-            query, {"survey_title": survey_title, "student_id": student_id}
+        conn = dbase.get_db_connection()
+        conn.row_factory = Answer._row_factory
+        answers = list(
+            conn.execute(
+                _SQL_GET_ANSWERS_BY_TITLE_AND_STUDENT,
+                {"survey_title": survey_title, "student_id": student_id},
+            )
         )
-        answers = [Answer(**answer) for answer in cursor]
         conn.close()
         return answers
+
+
+class LazyAnswer:
+    """A read-only view of an answers row.
+
+    Field access is delegated to the underlying sqlite3.Row; the choices
+    JSON is decoded only if the choices attribute is actually read.
+    """
+
+    __slots__ = ("_row", "_choices")
+
+    def __init__(self, row: sqlite3.Row) -> None:
+        self._row = row
+        self._choices: Optional[list[str]] = None
+
+    @property
+    def choices(self) -> list[str]:
+        """Selected choices, decoded from JSON on first access."""
+        if self._choices is None:
+            stored = self._row["choices"]
+            parsed = None
+            if stored.startswith("["):
+                try:
+                    parsed = _json_loads(stored)
+                except ValueError:
+                    parsed = None
+            self._choices = parsed if isinstance(parsed, list) else [stored]
+        return self._choices
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return self._row[name]
+        except IndexError:
+            raise AttributeError(name) from None
@@ -37,6 +37,8 @@ class FrcAttend(app.App):
     db_path: reactive.reactive[pathlib.Path | None] = reactive.reactive(None)
     config_path: reactive.reactive[pathlib.Path | None] = reactive.reactive(None)
     message = reactive.reactive("Debugging messages will show up here!")
+    dbase: model.DBase | None = None
+    """App-wide database handle, shared by screens instead of per-screen opens."""
 
     def compose(self) -> app.ComposeResult:
         """Add widgets to screen."""
@@ -147,6 +149,10 @@ class FrcAttend(app.App):
             submit_callback=_exit_if_no_pw, exit_on_cancel=True
         )
 
+    def on_unmount(self) -> None:
+        """Called when the app shuts down."""
+        model.DBase.close_pool()
+
     @textual.on(widgets.Button.Pressed, "#main-take-attendance")
     def action_take_attendance(self) -> None:
         """Put application in attenance mode, so students can scan QR codes."""
@@ -230,8 +236,9 @@ class FrcAttend(app.App):
             match export_path.suffix.lower():
                 case ".json":
                     dbase = model.DBase(config.settings.db_path)
-                    with open(export_path.with_suffix(".json"), "wt") as jfile:
-                        json.dump(dbase.to_dict(), jfile, indent=2)
+                    # Streams table rows straight to the file, so the
+                    # export never holds the whole database in memory.
+                    dbase.dump_json(export_path.with_suffix(".json"))
                     self.message = "Exporting JSON file."
                 case ".xlsx":
                     dbase = model.DBase(config.settings.db_path)
@@ -318,7 +325,11 @@ class FrcAttend(app.App):
         await self.app.push_screen(file_creator, _create_settings)
 
     def watch_db_path(self, db_path: str) -> None:
-        """Update the database path label."""
+        """Update the shared database handle and the path label."""
+        if db_path is not None and pathlib.Path(db_path).exists():
+            self.dbase = model.DBase(db_path)
+        else:
+            self.dbase = None
         self.query_one("#main-config-db-path", widgets.Label).update(str(db_path))
         self.query_one("#main-db-summary", widgets.Markdown).update(
             summary.get_summary()
@@ -333,16 +344,23 @@ class FrcAttend(app.App):
         # status_label = self.query_one("#main-status-message", widgets.Label)
         # status_label.update(self.message)
 
+    _ACTION_RULES = {
+        "manage_students": lambda active_screen: not isinstance(
+            active_screen, student_screen.StudentScreen
+        ),
+    }
+    """Per-action availability checks for the active screen.
+
+    check_action runs on every keypress, so actions dispatch through this
+    table instead of a match statement; actions without a rule are allowed.
+    """
+
     def check_action(self, action: str, parameters: tuple[object, ...]) -> bool | None:
         """Disable navigation actions when other screens are active."""
         if len(self.screen_stack) == 1:
             return True
-        if isinstance(self.screen_stack[-1], take_attendance.ScanScreen):
+        active_screen = self.screen_stack[-1]
+        if isinstance(active_screen, take_attendance.ScanScreen):
             return False
-        match action:
-            case "manage_students":
-                return not isinstance(
-                    self.screen_stack[-1], student_screen.StudentScreen
-                )
-            case _:
-                return True
+        rule = self._ACTION_RULES.get(action)
+        return True if rule is None else rule(active_screen)
@@ -1,6 +1,7 @@
 """Show attendance results."""
 
 import textual
+from rich import text
 from textual import app, binding, reactive, screen, widgets
 
 from frcattend import config, model, view
@@ -12,14 +13,25 @@ class StudentsTable(widgets.DataTable):
 
     dbase: model.DBase
     """Connection to Sqlite Database."""
-    students: dict[str, model.AttendanceStudent]
-    """Students with checkin totals."""
+
+    _COLUMNS = (
+        (text.Text("Last Name", style="green"), "last_name"),
+        (text.Text("First Name"), "first_name"),
+        (text.Text("Graduation Year"), "grad_year"),
+        (text.Text("Build Season Checkins", style="green"), "build_checkins"),
+        (text.Text("All Checkins"), "season_checkins"),
+        (text.Text("Last Checkin"), "last_checkin"),
+        (text.Text("Deactivated On", style="yellow"), "deactivated_on"),
+    )
+    """Column headers and keys, styled once at import time."""
+
+    _BLANK_CELL = text.Text("")
+    """Shared cell for the deactivated column, blank for active students."""
 
     def __init__(self, dbase: model.DBase, *args, **kwargs) -> None:
         """Set link to database."""
         super().__init__(zebra_stripes=True, *args, **kwargs)
         self.dbase = dbase
-        self.students = {}
 
     def on_mount(self) -> None:
         """Initialize the table."""
@@ -29,38 +41,39 @@ class StudentsTable(widgets.DataTable):
     def initialize_table(self) -> None:
         """Set up table columns."""
         self.cursor_type = "row"
-        for col in [
-            ("[green]Last Name[/]", "last_name"),
-            ("First Name", "first_name"),
-            ("Graduation Year", "grad_year"),
-            ("[green]Build Season Checkins[/]", "build_checkins"),
-            ("All Checkins", "season_checkins"),
-            ("Last Checkin", "last_checkin"),
-            ("[yellow]Deactivated On[/]", "deactivated_on"),
-        ]:
-            self.add_column(col[0], key=col[1])
+        for label, key in self._COLUMNS:
+            self.add_column(label, key=key)
 
     def update_table(self, include_inactive: bool) -> None:
         """Populae the table with students."""
         self.clear(columns=False)
-        self.students = {
-            student.student_id: student
-            for student in model.Attendance.get_student_attendance_students(
-                self.dbase, include_inactive=include_inactive
-            )
-        }
-        for key, stu in self.students.items():
-            deactivated_on = "" if stu.deactivated_on is None else stu.deactivated_iso
-            self.add_row(
-                f"[green]{stu.last_name}[/]",
-                stu.first_name,
-                stu.grad_year,
-                f"[green]{stu.build_checkins}[/]",
-                stu.year_checkins,
-                stu.last_checkin,
-                f"[yellow]{deactivated_on}[/]",
-                key=key,
-            )
+        students = model.Attendance.get_student_attendance_students(
+            self.dbase, include_inactive=include_inactive
+        )
+        # Row keys double as student IDs, so no side dict of students is
+        # kept; the table is the single copy of the loaded rows. Batching
+        # the inserts means the table repaints once instead of once per
+        # student, and styled Text cells skip the Rich markup parse that
+        # f-strings like "[green]...[/]" would cost on every cell.
+        with self.app.batch_update():
+            for stu in students:
+                # Most students are active, so the common case reuses one
+                # prebuilt blank cell instead of allocating per row.
+                deact_cell = (
+                    self._BLANK_CELL
+                    if stu.deactivated_on is None
+                    else text.Text(stu.deactivated_iso, style="yellow")
+                )
+                self.add_row(
+                    text.Text(stu.last_name, style="green"),
+                    stu.first_name,
+                    stu.grad_year,
+                    text.Text(str(stu.build_checkins), style="green"),
+                    stu.year_checkins,
+                    stu.last_checkin,
+                    deact_cell,
+                    key=stu.student_id,
+                )
         self.refresh()
 
 
@@ -69,8 +82,8 @@ class CheckinTable(widgets.DataTable):
 
     dbase: model.DBase
     """Connection to Sqlite Database."""
-    checkins: dict[int, model.Checkin]
-    """Checkins for selected student."""
+    _checkins_by_student: dict[str, list[model.Checkin]]
+    """All checkins prefetched at mount, grouped by student ID."""
     student_id: reactive.reactive[str | None] = reactive.reactive(None)
     """ID of selected student."""
 
@@ -78,22 +91,31 @@ class CheckinTable(widgets.DataTable):
         """Set link to database."""
         super().__init__(zebra_stripes=True, *args, **kwargs)
         self.dbase = dbase
-        self.checkins = {}
+        self._checkins_by_student = {}
 
     def on_mount(self) -> None:
-        """Initialize the table."""
+        """Initialize the table and prefetch all checkin history.
+
+        Scrolling the student table highlights a new row per keypress;
+        one grouped query here means those highlights never hit the
+        database.
+        """
         self.initialize_table()
+        self._checkins_by_student = model.Checkin.get_all_by_student(self.dbase)
+
+    _COLUMNS = (
+        ("Date", "iso_date"),
+        ("Day", "day_of_week"),
+        ("Type", "event_type"),
+        ("Timestamp", "timestamp"),
+    )
+    """Column headers and keys."""
 
     def initialize_table(self) -> None:
         """Define table columns."""
         self.cursor_type = "row"
-        for col in [
-            ("Date", "iso_date"),
-            ("Day", "day_of_week"),
-            ("Type", "event_type"),
-            ("Timestamp", "timestamp"),
-        ]:
-            self.add_column(col[0], key=col[1])
+        for label, key in self._COLUMNS:
+            self.add_column(label, key=key)
 
     def watch_student_id(self) -> None:
         """Add checkins for the specified student to the table."""
@@ -101,20 +123,16 @@ class CheckinTable(widgets.DataTable):
         if self.student_id is None:
             return
         self.clear(columns=False)
-        self.checkins = {
-            checkin.checkin_id: checkin
-            for checkin in model.Checkin.get_checkins_by_student(
-                self.dbase, self.student_id
-            )
-        }
-        for checkin_id, checkin in self.checkins.items():
-            self.add_row(
-                checkin.iso_date,
-                checkin.day_of_week,
-                checkin.event_type.value,
-                checkin.timestamp,
-                key=str(checkin_id),
-            )
+        checkins = self._checkins_by_student.get(self.student_id, ())
+        with self.app.batch_update():
+            for checkin in checkins:
+                self.add_row(
+                    checkin.iso_date,
+                    checkin.day_of_week,
+                    checkin.event_type.value,
+                    checkin.timestamp,
+                    key=str(checkin.checkin_id),
+                )
         self.refresh()
 
 
@@ -136,7 +154,11 @@ class AttendanceScreen(screen.Screen):
         super().__init__()
         if config.settings.db_path is None:
             raise model.DBaseError("No database file selected.")
-        self.dbase = model.DBase(config.settings.db_path)
+        # Reuse the app-wide handle when available; its pooled connections
+        # stay warm across screen pushes.
+        self.dbase = getattr(self.app, "dbase", None) or model.DBase(
+            config.settings.db_path
+        )
 
     def compose(self) -> app.ComposeResult:
         """Add the datatable and other controls to the screen."""
@@ -137,7 +137,9 @@ class EventScreen(screen.Screen):
         super().__init__()
         if config.settings.db_path is None:
             raise model.DBaseError("No database file selected.")
-        self.dbase = model.DBase(config.settings.db_path)
+        self.dbase = getattr(self.app, "dbase", None) or model.DBase(
+            config.settings.db_path
+        )
 
     def compose(self) -> app.ComposeResult:
         """Add the datatable and other controls to the screen."""
@@ -218,7 +220,7 @@ class EditEventDialog(screen.ModalScreen[bool]):
                 value=event.iso_date,
                 disabled=(self.event.checkin_count > 0),
                 id="event-date-input",
-                validators=[validators.DateValidator()],
+                validators=[validators.DATE_VALIDATOR],
             )
             yield widgets.Label("Event Type:")
             yield widgets.Select(
@@ -13,11 +13,14 @@ class StudentDialog(screen.ModalScreen):
     CSS_PATH = frcattend.view.CSS_FOLDER / "student_dialog.tcss"
 
     student: model.Student | None
+    _inputs: dict[str, widgets.Input]
+    """Input widgets cached at mount, keyed by short name."""
 
     def __init__(self, student: model.Student | None = None) -> None:
         """Initialize with student information if provided."""
         super().__init__()
         self.student = student
+        self._inputs = {}
 
     def compose(self) -> app.ComposeResult:
         """Create and arrange dialog widgets."""
@@ -31,19 +34,19 @@ class StudentDialog(screen.ModalScreen):
                 value=self.student.first_name if self.student else "",
                 placeholder="First Name",
                 id="s-fname",
-                validators=[validators.NotEmpty()],
+                validators=[validators.NOT_EMPTY],
             )
             yield widgets.Input(
                 value=self.student.last_name if self.student else "",
                 placeholder="Last Name",
                 id="s-lname",
-                validators=[validators.NotEmpty()],
+                validators=[validators.NOT_EMPTY],
             )
             yield widgets.Input(
                 value=self.student.email if self.student else "",
                 placeholder="Email",
                 id="s-email",
-                validators=[validators.NotEmpty()],
+                validators=[validators.NOT_EMPTY],
             )
             yield widgets.Input(
                 value=(
@@ -53,7 +56,7 @@ class StudentDialog(screen.ModalScreen):
                 ),
                 placeholder="Graduation Year",
                 id="s-gyear",
-                validators=[validators.NotEmpty(), validators.IsYear()],
+                validators=[validators.NOT_EMPTY, validators.IS_YEAR],
             )
             yield widgets.Label("Deactivated on:", classes="emphasis")
             yield widgets.Input(
@@ -63,7 +66,7 @@ class StudentDialog(screen.ModalScreen):
                     else ""
                 ),
                 placeholder="YYYY-MM-DD or leave blank if active",
-                validators=[validators.DateValidator()],
+                validators=[validators.DATE_VALIDATOR],
                 id="s-deactivated",
             )
 
@@ -73,7 +76,10 @@ class StudentDialog(screen.ModalScreen):
                 yield widgets.Button("Cancel", id="cancel-student")
 
     def on_mount(self) -> None:
-        self.query_one("#s-fname", widgets.Input).focus()
+        """Cache the input widgets; each query_one is a DOM/selector walk."""
+        for name in ("fname", "lname", "email", "gyear", "deactivated"):
+            self._inputs[name] = self.query_one(f"#s-{name}", widgets.Input)
+        self._inputs["fname"].focus()
 
     # Not used?
     def on_button_pressed(self, event: widgets.Button.Pressed) -> None:
@@ -91,20 +97,14 @@ class StudentDialog(screen.ModalScreen):
                 )
 
         elif event.button.id == "save-student":
+            gyear = self._inputs["gyear"].value
+            deactivated = self._inputs["deactivated"].value
             data = {
-                "first_name": self.query_one("#s-fname", widgets.Input).value,
-                "last_name": self.query_one("#s-lname", widgets.Input).value,
-                "email": self.query_one("#s-email", widgets.Input).value or None,
-                "grad_year": (
-                    int(self.query_one("#s-gyear", widgets.Input).value)
-                    if self.query_one("#s-gyear", widgets.Input).value
-                    else None
-                ),
-                "deactivated_on": (
-                    self.query_one("#s-deactivated", widgets.Input).value
-                    if self.query_one("#s-deactivated", widgets.Input).value
-                    else None
-                ),
+                "first_name": self._inputs["fname"].value,
+                "last_name": self._inputs["lname"].value,
+                "email": self._inputs["email"].value or None,
+                "grad_year": int(gyear) if gyear else None,
+                "deactivated_on": deactivated if deactivated else None,
             }
             if self.student is None:
                 data["student_id"] = ""
@@ -43,7 +43,9 @@ class StudentScreen(screen.Screen):
         super().__init__()
         if config.settings.db_path is None:
             raise model.DBaseError("No database file selected.")
-        self.dbase = model.DBase(config.settings.db_path)
+        self.dbase = getattr(self.app, "dbase", None) or model.DBase(
+            config.settings.db_path
+        )
         self._students = {}
 
     def compose(self) -> app.ComposeResult:
@@ -1,10 +1,12 @@
 """Create, edit, and view surveys."""
 
-import datetime
+import re
+import types
 from typing import Optional, TYPE_CHECKING
 
 import textual
-from textual import app, binding, containers, message, screen, validation, widgets
+from textual import app, binding, containers, message, screen, timer, validation
+from textual import widget, widgets
 from textual.widgets import option_list
 
 from frcattend import config, model
@@ -15,6 +17,10 @@ if TYPE_CHECKING:
     from frcattend.view import take_attendance
 
 
+_CHOICE_RE = re.compile(r"^[ \t]*(\S.*?)[ \t]*$", re.MULTILINE)
+"""Matches one trimmed, non-blank choice per TextArea line."""
+
+
 class SurveyScreen(screen.Screen):
     """Manage surveys."""
 
@@ -22,10 +28,22 @@ class SurveyScreen(screen.Screen):
     """Connection to Sqlite Database."""
     survey_table: widgets.DataTable
     """Table that holds survey data."""
+    _details: widgets.Static
+    """Details panel, cached at mount."""
+    _edit_btn: widgets.Button
+    """Edit button, cached at mount."""
+    _delete_btn: widgets.Button
+    """Delete button, cached at mount."""
+    _pending_survey: Optional[model.Survey]
+    """Survey awaiting a debounced details render."""
+    _details_timer: Optional[timer.Timer]
+    """Pending timer for the debounced details render."""
     _selected_survey_title: Optional[str]
     """Currently selected survey."""
     _surveys: dict[str, model.Survey]
     """List of surveys currently loaded in the datatable."""
+    _detail_cache: dict[str, str]
+    """Rendered details markup, keyed by survey title."""
 
     CSS_PATH = frcattend.view.CSS_FOLDER / "survey_screen.tcss"
     BINDINGS = [
@@ -37,8 +55,13 @@ class SurveyScreen(screen.Screen):
         super().__init__()
         if config.settings.db_path is None:
             raise model.DBaseError("No database file selected.")
-        self.dbase = model.DBase(config.settings.db_path)
+        self.dbase = getattr(self.app, "dbase", None) or model.DBase(
+            config.settings.db_path
+        )
         self._surveys = {}
+        self._detail_cache = {}
+        self._pending_survey = None
+        self._details_timer = None
 
     def compose(self) -> app.ComposeResult:
         """Build the survey screen's user interface."""
@@ -76,6 +99,9 @@ class SurveyScreen(screen.Screen):
 
     def on_mount(self) -> None:
         """Initialize the datatable widget."""
+        self._details = self.query_one("#survey-details", widgets.Static)
+        self._edit_btn = self.query_one("#edit-survey", widgets.Button)
+        self._delete_btn = self.query_one("#delete-survey", widgets.Button)
         self.initialize_survey_table()
         self.load_survey_table()
 
@@ -90,52 +116,107 @@ class SurveyScreen(screen.Screen):
             self.survey_table.add_column(col[0], key=col[1], width=col[2])
 
     def load_survey_table(self) -> None:
+        """Reload the survey table without blocking the UI."""
+        self._fetch_surveys()
+
+    @textual.work(thread=True, exclusive=True)
+    def _fetch_surveys(self) -> None:
+        """Fetch surveys off the event-loop thread.
+
+        The screen paints immediately with an empty table; rows arrive via
+        call_from_thread once the query finishes. exclusive=True cancels a
+        stale fetch if the table is reloaded again first.
+        """
+        surveys = model.Survey.get_all(self.dbase)
+        self.app.call_from_thread(self._populate_survey_table, surveys)
+
+    def _populate_survey_table(self, surveys: list[model.Survey]) -> None:
         """Load survey data into the datatable widget."""
         self.survey_table.clear(columns=False)
-        self._surveys = {
-            survey.title: survey for survey in model.Survey.get_all(self.dbase)
-        }
-        for survey in self._surveys.values():
-            self.survey_table.add_row(survey.title, survey.question, key=survey.title)
+        # One pass fills the lookup dict and the table together. Batching
+        # the inserts means the table repaints once per reload instead of
+        # once per survey; add_rows can't carry the title row keys.
+        self._surveys = {}
+        self._detail_cache.clear()
+        with self.app.batch_update():
+            for survey in surveys:
+                self._surveys[survey.title] = survey
+                self.survey_table.add_row(
+                    survey.title, survey.question, key=survey.title
+                )
         self._selected_survey_title = None
 
     def on_data_table_row_selected(self, event: widgets.DataTable.RowSelected) -> None:
         """Select a row in the datatable."""
+        # Re-clicking the already-selected row changes nothing, so skip
+        # the button toggles and details rebuild entirely.
+        if event.row_key.value == self._selected_survey_title:
+            return
         self._selected_survey_title = event.row_key.value
         if self._selected_survey_title is None:
             return
-        self.query_one("#edit-survey", widgets.Button).disabled = False
-        self.query_one("#delete-survey", widgets.Button).disabled = False
-        survey = self._surveys[self._selected_survey_title]
-        self.update_details(survey)
+        # Writing disabled triggers a stylesheet apply even when the value
+        # is unchanged, so only touch it when the buttons are still off.
+        if self._edit_btn.disabled:
+            self._edit_btn.disabled = False
+            self._delete_btn.disabled = False
+        # Debounce the details render so rapid selection changes coalesce
+        # into a single rebuild of the panel.
+        self._pending_survey = self._surveys[self._selected_survey_title]
+        if self._details_timer is not None:
+            self._details_timer.stop()
+        self._details_timer = self.set_timer(0.05, self._flush_details)
+
+    def _flush_details(self) -> None:
+        """Render the details panel for the most recently selected survey."""
+        self._details_timer = None
+        if self._pending_survey is not None:
+            self.update_details(self._pending_survey)
 
     def update_details(self, survey: model.Survey) -> None:
         """Update the survey details panel."""
-        details = f"[bold]Title:[/bold] {survey.title}\n\n"
-        details += f"[bold]Question:[/bold] {survey.question}\n\n"
-        details += "[bold]Choices:[/bold]\n"
-        for i, choice in enumerate(survey.choices, 1):
-            details += f"  {i}. {choice}\n"
-        details += (
+        # Surveys rarely change, so arrow-key navigation back to a row
+        # reuses the markup rendered the first time it was selected.
+        cached = self._detail_cache.get(survey.title)
+        if cached is not None:
+            self._details.update(cached)
+            return
+        # Collect the pieces and join once; += on str reallocates per line.
+        parts = [
+            f"[bold]Title:[/bold] {survey.title}\n\n",
+            f"[bold]Question:[/bold] {survey.question}\n\n",
+            "[bold]Choices:[/bold]\n",
+        ]
+        parts.extend(
+            f"  {i}. {choice}\n" for i, choice in enumerate(survey.choices, 1)
+        )
+        parts.append(
             f"\n[bold]Multiselect:[/bold] {'Yes' if survey.multiselect else 'No'}\n"
         )
-        details += (
+        parts.append(
             f"[bold]Allow Freetext:[/bold] {'Yes' if survey.allow_freetext else 'No'}\n"
         )
         if survey.max_length:
-            details += f"[bold]Max Length:[/bold] {survey.max_length}\n"
+            parts.append(f"[bold]Max Length:[/bold] {survey.max_length}\n")
         replace = "Yes" if survey.allow_freetext else "No"
-        details += f"[bold]Replace Prior Answer:[/bold] {replace}\n"
-        self.query_one("#survey-details", widgets.Static).update(details)
+        parts.append(f"[bold]Replace Prior Answer:[/bold] {replace}\n")
+        markup = "".join(parts)
+        self._detail_cache[survey.title] = markup
+        self._details.update(markup)
 
     @textual.work
     @textual.on(widgets.Button.Pressed, "#add-survey")
     async def action_add_survey(self) -> None:
         """Show the survey dialog and add a new survey."""
-        if await self.app.push_screen_wait(
+        survey = await self.app.push_screen_wait(
             EditSurveyDialog(dbase=self.dbase, survey=None)
-        ):
-            self.load_survey_table()
+        )
+        if survey is None:
+            return
+        # Insert just the new row instead of clearing and reloading the
+        # whole table.
+        self._surveys[survey.title] = survey
+        self.survey_table.add_row(survey.title, survey.question, key=survey.title)
 
     @textual.work
     @textual.on(widgets.Button.Pressed, "#edit-survey")
@@ -143,24 +224,41 @@ class SurveyScreen(screen.Screen):
         """Edit the selected survey."""
         if self._selected_survey_title is None:
             return
-        if await self.app.push_screen_wait(
+        survey = await self.app.push_screen_wait(
             EditSurveyDialog(
                 dbase=self.dbase, survey=self._surveys[self._selected_survey_title]
             )
-        ):
-            self.load_survey_table()
+        )
+        if survey is None:
+            return
+        # Titles are fixed during edits, so updating the question cell in
+        # place avoids an O(N) clear-and-reload.
+        self._surveys[survey.title] = survey
+        self.survey_table.update_cell(survey.title, "question", survey.question)
+        self._detail_cache.pop(survey.title, None)
+        self.update_details(survey)
 
     @textual.on(widgets.Button.Pressed, "#delete-survey")
     async def action_delete_survey(self) -> None:
         """Delete the selected survey."""
         if self._selected_survey_title is None:
             return
-        model.Survey.delete_by_title(self.dbase, self._selected_survey_title)
-        self.load_survey_table()
+        title = self._selected_survey_title
+        model.Survey.delete_by_title(self.dbase, title)
+        self.survey_table.remove_row(title)
+        del self._surveys[title]
+        self._detail_cache.pop(title, None)
+        self._selected_survey_title = None
+        self._edit_btn.disabled = True
+        self._delete_btn.disabled = True
 
 
-class EditSurveyDialog(screen.ModalScreen):
-    """A dialog for adding or editing surveys."""
+class EditSurveyDialog(screen.ModalScreen[Optional[model.Survey]]):
+    """A dialog for adding or editing surveys.
+
+    Dismisses with the saved Survey, or None if cancelled or the save
+    failed, so the screen can update just the affected table row.
+    """
 
     CSS_PATH = frcattend.view.CSS_FOLDER / "survey_screen.tcss"
 
@@ -170,17 +268,40 @@ class EditSurveyDialog(screen.ModalScreen):
     """Database containing survey data."""
     _validator_results: dict[str, validation.ValidationResult | None]
     """Validation results for dialog inputs, [id: ValidationResult]."""
+    _w: dict[str, widget.Widget]
+    """Dialog widgets cached at mount, keyed by short name."""
+
+    _DEFAULT_VALIDATORS = types.MappingProxyType(
+        {
+            "survey-title-input": None,
+            "survey-question-input": None,
+            "survey-max-length-input": None,
+        }
+    )
+    """Template for per-dialog validation results, copied on open."""
 
     def __init__(self, dbase: model.DBase, survey: model.Survey | None = None) -> None:
         """Set survey information if provided."""
         super().__init__()
         self.dbase = dbase
         self.survey = survey
-        self._validator_results = {
-            "survey-title-input": None,
-            "survey-question-input": None,
-            "survey-max-length-input": None,
+        self._validator_results = dict(self._DEFAULT_VALIDATORS)
+        self._w = {}
+
+    def on_mount(self) -> None:
+        """Cache widget references; each query_one is a DOM/selector walk."""
+        self._w = {
+            "question": self.query_one("#survey-question-input", widgets.Input),
+            "choices": self.query_one("#survey-choices-text", widgets.TextArea),
+            "multiselect": self.query_one(
+                "#survey-multiselect-checkbox", widgets.Checkbox
+            ),
+            "freetext": self.query_one("#survey-freetext-checkbox", widgets.Checkbox),
+            "max_length": self.query_one("#survey-max-length-input", widgets.Input),
+            "replace": self.query_one("#survey-replace-checkbox", widgets.Checkbox),
         }
+        if self.survey is None:
+            self._w["title"] = self.query_one("#survey-title-input", widgets.Input)
 
     def compose(self) -> app.ComposeResult:
         """Create and arrange dialog widgets."""
@@ -194,7 +315,7 @@ class EditSurveyDialog(screen.ModalScreen):
                     placeholder="Title",
                     id="survey-title-input",
                     classes="validated",
-                    validators=[validators.NotEmpty()],
+                    validators=[validators.NOT_EMPTY],
                     tooltip=(
                         "Add a short title that describes the surveys. "
                         "Titles must be unique, so ensure this title is different from "
@@ -206,11 +327,11 @@ class EditSurveyDialog(screen.ModalScreen):
                 placeholder="Question",
                 id="survey-question-input",
                 classes="validated",
-                validators=[validators.NotEmpty()],
+                validators=[validators.NOT_EMPTY],
                 tooltip=("Enter the survey question."),
             )
             yield widgets.TextArea(
-                text="" if self.survey is None else "\n".join(self.survey.choices),
+                text="" if self.survey is None else self.survey.choices_text,
                 id="survey-choices-text",
                 tooltip=("Enter each choice on a separate line."),
             )
@@ -238,7 +359,7 @@ class EditSurveyDialog(screen.ModalScreen):
                         "if left empty. Has no effect if 'Allow freetext answer' is "
                         "not checked."
                     ),
-                    validators=[validators.IsPositiveInteger()],
+                    validators=[validators.IS_POSITIVE_INTEGER],
                 )
             yield widgets.Checkbox(
                 "Allow student to select multiple choices.",
@@ -265,8 +386,7 @@ class EditSurveyDialog(screen.ModalScreen):
     @textual.on(widgets.Checkbox.Changed, "#survey-freetext-checkbox")
     def on_freetext_check(self, message: widgets.Checkbox.Changed) -> None:
         """Toggle max-length disabled state when freetext checkbox is changed."""
-        freetext_len = self.query_one("#survey-max-length-input", widgets.Input)
-        freetext_len.disabled = not message.checkbox.value
+        self._w["max_length"].disabled = not message.checkbox.value
 
     @textual.on(widgets.Input.Blurred, ".validated")
     def on_blur(self, message: widgets.Input.Blurred) -> None:
@@ -277,39 +397,37 @@ class EditSurveyDialog(screen.ModalScreen):
     @textual.on(widgets.Button.Pressed, "#cancel-survey")
     def cancel_dialog(self) -> None:
         """Close the dialog and take no action."""
-        self.dismiss(False)
+        self.dismiss(None)
 
     @textual.on(widgets.Button.Pressed, "#save-survey")
     def save_survey(self) -> None:
         """Save the survey information when the user clicks the Save button."""
-        valid = True
         add_new = self.survey is None
-        for widget_id, val_result in self._validator_results.items():
-            if (
-                isinstance(val_result, validation.ValidationResult)
-                and not val_result.is_valid
-            ):
-                valid = False
-                self.notify(
-                    f"Invalid input for {widget_id}: {val_result.failure_descriptions}"
-                )
-        if not valid:
+        # Collect every failure and raise one notification instead of one
+        # toast per invalid widget.
+        failures = [
+            f"Invalid input for {widget_id}: {val_result.failure_descriptions}"
+            for widget_id, val_result in self._validator_results.items()
+            if isinstance(val_result, validation.ValidationResult)
+            and not val_result.is_valid
+        ]
+        if failures:
+            self.notify("\n".join(failures))
             return
-        question = self.query_one("#survey-question-input", widgets.Input).value
-        choice_input = self.query_one("#survey-choices-text", widgets.TextArea)
-        choices = [choice.strip() for choice in choice_input.text.split("\n")]
-        multiselect = self.query_one(
-            "#survey-multiselect-checkbox", widgets.Checkbox
-        ).value
-        freetext = self.query_one("#survey-freetext-checkbox", widgets.Checkbox).value
-        max_length_raw = self.query_one("#survey-max-length-input", widgets.Input).value
+        question = self._w["question"].value
+        # One C-level findall splits, trims, and drops blank lines in a
+        # single pass instead of splitlines plus a Python-level loop.
+        choices = _CHOICE_RE.findall(self._w["choices"].text)
+        multiselect = self._w["multiselect"].value
+        freetext = self._w["freetext"].value
+        max_length_raw = self._w["max_length"].value
         if not max_length_raw or max_length_raw is None:
             max_length = None
         else:
             max_length = int(max_length_raw)
-        replace = self.query_one("#survey-replace-checkbox", widgets.Checkbox).value
+        replace = self._w["replace"].value
         if self.survey is None:
-            title = self.query_one("#survey-title-input", widgets.Input).value
+            title = self._w["title"].value
         else:
             title = self.survey.title
         self.survey = model.Survey(
@@ -327,7 +445,29 @@ class EditSurveyDialog(screen.ModalScreen):
             success = self.survey.update(self.dbase)
         if not success:
             self.notify("Error updating survey.")
-        self.dismiss(success)
+        self.dismiss(self.survey if success else None)
+
+
+_survey_options: dict[tuple[str, tuple[str, ...]], tuple] = {}
+"""Prebuilt OptionList/SelectionList items, keyed by survey title and choices.
+
+During a check-in rush every student answers the same survey, so the
+items are built once and reused; keying on the choices tuple means an
+edited survey gets fresh items automatically.
+"""
+
+
+def _items_for_survey(survey: model.Survey) -> tuple:
+    """Return cached OptionList or SelectionList items for a survey."""
+    key = (survey.title, tuple(survey.choices))
+    items = _survey_options.get(key)
+    if items is None:
+        if survey.multiselect:
+            items = tuple((s, s) for s in survey.choices)
+        else:
+            items = tuple(option_list.Option(s, id=s) for s in survey.choices)
+        _survey_options[key] = items
+    return items
 
 
 class TakeSurveyDialog(screen.ModalScreen):
@@ -373,12 +513,11 @@ class TakeSurveyDialog(screen.ModalScreen):
             yield widgets.Static(
                 self.survey.question, id="take-survey-question", classes="emphasis"
             )
+            items = _items_for_survey(self.survey)
             if self.survey.multiselect:
-                selections = [(s, s) for s in self.survey.choices]
-                yield widgets.SelectionList[str](*selections, id="take-survey-multi")
+                yield widgets.SelectionList[str](*items, id="take-survey-multi")
             else:
-                options = [option_list.Option(s, id=s) for s in self.survey.choices]
-                yield widgets.OptionList(*options, id="take-survey-single")
+                yield widgets.OptionList(*items, id="take-survey-single")
             if self.survey.allow_freetext:
                 yield widgets.Label("Custom Answer", id="take-survey-freetext-label")
                 yield widgets.Input(id="take-survey-freetext")
@@ -410,11 +549,13 @@ class TakeSurveyDialog(screen.ModalScreen):
         else:
             freetext = None
         """Close the dialog and return to the main screen."""
+        # Answer defaults answer_date to today's date, so the click path
+        # skips the datetime lookup chain (and avoids storing a datetime
+        # where a date is expected).
         answer = model.Answer(
             self.student.student_id,
             self.survey.title,
             choices,
-            datetime.datetime.today(),
             freetext_answer=freetext,
         )
         answer.add(self.dbase)
@@ -1,15 +1,15 @@
 """Turn on camera and scan QR Codes."""
 
-import asyncio
 import dataclasses
 import datetime
+import sqlite3
 import time
 from typing import cast, Optional
 
 import cv2
 
 import textual
-from textual import app, containers, message, screen, widgets
+from textual import app, containers, message, screen, widgets, worker
 from textual.widgets import option_list
 
 from frcattend import config, model
@@ -24,8 +24,10 @@ class ScanScreen(screen.Screen):
 
     dbase: model.DBase
     """Sqlte database connection object."""
-    _students: dict[str, model.Student]
-    """Mapping of student IDs to student records."""
+    _student_cache: dict[str, Optional[model.Student]]
+    """Students looked up so far, keyed by ID. None marks unknown IDs."""
+    _active_ids: frozenset[str]
+    """IDs of active students, for cheap is-active checks per scan."""
     log_widget: widgets.RichLog
     """Displays checking results."""
     event_type: model.EventType
@@ -34,8 +36,19 @@ class ScanScreen(screen.Screen):
     """Students can be asked to complete a survey when they checkin."""
     _checkedin_students: set[str]
     """Recently scanned student IDs."""
-    _scanned_students: set[str]
-    """Students who have scanned their QR code within the last few seconds."""
+    _scanned_at: dict[str, float]
+    """Monotonic time of each QR code's last scan, for rescan debounce."""
+
+    _RESCAN_SECONDS = 5.0
+    """How long a QR code is ignored after it has been scanned."""
+    _pending_checkins: list[model.Checkin]
+    """Checkins waiting to be flushed to the database in one transaction."""
+    _log_buffer: list[str]
+    """Messages waiting to be written to the log in one combined write."""
+    _vcap: Optional[cv2.VideoCapture]
+    """Camera handle, kept open across scan restarts."""
+    _detector: Optional[cv2.QRCodeDetector]
+    """QR detector, reused across scan restarts."""
 
     BINDINGS = [
         (
@@ -51,11 +64,22 @@ class ScanScreen(screen.Screen):
         super().__init__()
         if config.settings.db_path is None:
             raise model.DBaseError("No database file selected.")
-        self.dbase = model.DBase(config.settings.db_path)
-        self._students = {
-            student.student_id: student
-            for student in model.Student.get_all(self.dbase, include_inactive=True)
-        }
+        self.dbase = getattr(self.app, "dbase", None) or model.DBase(
+            config.settings.db_path
+        )
+        # Students are fetched lazily per scanned ID instead of loading
+        # the whole roster (years of alumni included) before the first
+        # scan; student_id is the primary key, so each miss is one
+        # point query. Only the compact active-ID set is loaded up
+        # front, so active/deactivated checks never fetch a full row.
+        self._student_cache = {}
+        self._active_ids = frozenset(
+            model.Student.get_all_ids(self.dbase, include_inactive=False)
+        )
+        self._pending_checkins = []
+        self._log_buffer = []
+        self._vcap = None
+        self._detector = None
 
     class QrCodeFound(message.Message):
         def __init__(self, code: str) -> None:
@@ -72,6 +96,9 @@ class ScanScreen(screen.Screen):
     def on_mount(self) -> None:
         """Request type of event then start the scanner."""
         self.log_widget = self.query_one("#attendance-log", widgets.RichLog)
+        # One combined write per tick keeps a scanning burst from forcing
+        # a log repaint per student.
+        self.set_interval(0.1, self._flush_log)
         self.app.push_screen(
             ChooseTypeAndSurveyDialog(self.dbase),
             callback=self.set_event_type_and_start_scanning,
@@ -90,107 +117,222 @@ class ScanScreen(screen.Screen):
         event = model.Event(today, result.event_type)
         event.add(self.dbase)
         # Prevent codes from being scanned more than once for same event.
-        self._checkedin_students = set(
-            model.Checkin.get_checkedin_students(self.dbase, today, result.event_type)
+        self._checkedin_students = model.Checkin.get_checkedin_student_set(
+            self.dbase, today, result.event_type
         )
+        # Batch checkin writes so a scanning burst pays one commit per
+        # flush instead of one per student.
+        self.set_interval(2.0, self._flush_checkins)
         # Force a small delay to ensure dialog is fully dismissed before camera opens
         self.set_timer(0.1, self.scan_qr_codes)  # Timer allows dialog to be dismissed.
 
-    @textual.work(exclusive=False)
-    async def scan_qr_codes(self) -> None:
-        """Open video window and capture QR codes."""
-        vcap = cv2.VideoCapture(config.settings.camera_number)
-        detector = cv2.QRCodeDetector()
+    @textual.work(exclusive=False, thread=True)
+    def scan_qr_codes(self) -> None:
+        """Open video window and capture QR codes.
+
+        Runs on a worker thread: detectAndDecode can take hundreds of
+        milliseconds on busy frames, which would starve Textual's event
+        loop of render ticks if the scan loop ran on it. UI work is
+        marshalled back with call_from_thread.
+        """
+        # Opening the camera can take a second or more, so the handle and
+        # the detector survive survey restarts and are only released when
+        # the screen is popped.
+        if self._vcap is None or not self._vcap.isOpened():
+            self._vcap = cv2.VideoCapture(config.settings.camera_number)
+            # A 1-frame buffer keeps detection working on the newest frame
+            # instead of stale queued ones; some backends ignore the
+            # request, in which case the grab() calls below still drain
+            # the queue.
+            self._vcap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        if self._detector is None:
+            self._detector = cv2.QRCodeDetector()
+        vcap = self._vcap
+        detector = self._detector
         qr_data: str | None = None
-        self._scanned_students = set()
+        self._scanned_at = {}
+        # QR detection only needs ~5 FPS to feel responsive. grab() is a
+        # cheap queue advance that keeps the driver buffer drained, while
+        # retrieve() pays the full frame decode, so only every sixth
+        # grabbed frame is decoded and searched for a code.
+        frame_skip = 6
+        frame_idx = 0
+        # Reused by cv2.flip as the destination so mirroring the preview
+        # writes into one buffer instead of allocating a frame per pass.
+        disp_img = None
+        # Pace the loop at the typical camera rate so the worker thread
+        # doesn't spin between frames.
+        loop_period = 1 / 30
+        scan_worker = worker.get_current_worker()
         while True:
+            # The screen's q binding pops the screen and cancels its
+            # workers; bail out through the window-cleanup path instead
+            # of spinning against a released capture.
+            if scan_worker.is_cancelled:
+                cv2.destroyAllWindows()
+                return
+            next_tick = time.monotonic() + loop_period
             try:
-                _, img = vcap.read()
-                window_title = "Scan QR Codes (Click on window and press q to exit)"
-                # Mirror view for display
-                disp_img = cv2.flip(img, 1)
-                cv2.imshow(window_title, disp_img)
-
-                qr_data, bbox, straight_code = detector.detectAndDecode(img)
+                vcap.grab()
+                frame_idx += 1
+                if frame_idx % frame_skip == 0:
+                    got_frame, img = vcap.retrieve()
+                    if not got_frame or img is None:
+                        # No frame (wrong camera number, device busy, or
+                        # capture released); keep pacing instead of
+                        # crashing the worker on a None frame.
+                        time.sleep(max(0.0, next_tick - time.monotonic()))
+                        continue
+                    window_title = (
+                        "Scan QR Codes (Click on window and press q to exit)"
+                    )
+                    # Mirror view for display
+                    if disp_img is None:
+                        disp_img = img.copy()
+                    cv2.flip(img, 1, dst=disp_img)
+                    cv2.imshow(window_title, disp_img)
+
+                    # Detection is color-blind and scales with pixel
+                    # count, so search a half-size grayscale copy while
+                    # the preview keeps the full-resolution frame.
+                    gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+                    small = cv2.resize(
+                        gray, None, fx=0.5, fy=0.5, interpolation=cv2.INTER_AREA
+                    )
+                    qr_data, bbox, straight_code = detector.detectAndDecode(small)
+                else:
+                    qr_data = None
             except cv2.error:
+                # Still pace the loop on camera errors so a failing
+                # capture can't spin a core.
+                time.sleep(max(0.0, next_tick - time.monotonic()))
                 continue
             if qr_data:
-                if qr_data not in self._scanned_students:
-                    self._scanned_students.add(qr_data)
-                    self.post_message(self.QrCodeFound(qr_data))
-                    if self.survey is not None and qr_data in self._students:
-                        if self._students[qr_data].deactivated_on is None:
-                            self.app.push_screen(
+                # A timestamp check replaces the old per-scan sleeping
+                # thread: codes older than the debounce window are simply
+                # overwritten, no timers or threads needed.
+                now = time.monotonic()
+                if now - self._scanned_at.get(qr_data, 0.0) >= self._RESCAN_SECONDS:
+                    self._scanned_at[qr_data] = now
+                    self.app.call_from_thread(
+                        self.post_message, self.QrCodeFound(qr_data)
+                    )
+                    # The set test keeps inactive and unknown scans from
+                    # paying a student fetch here.
+                    if self.survey is not None and qr_data in self._active_ids:
+                        student = self._lookup_student(qr_data)
+                        if student is not None:
+                            self.app.call_from_thread(
+                                self.app.push_screen,
                                 survey_screen.TakeSurveyDialog(
                                     self.dbase,
                                     self,
                                     self.survey,
-                                    self._students[qr_data],
-                                )
+                                    student,
+                                ),
                             )
-                            vcap.release()
+                            # Keep the camera open; restart_scanning
+                            # resumes within a frame instead of paying
+                            # the device re-open.
                             cv2.destroyAllWindows()
                             return
-                    await asyncio.sleep(0.1)  # Allow log to update.
-            wait_key = cv2.waitKey(50)  # Wait 50 miliseconds for key press.
+            # waitKey(1) is one event-pump pass; the OS rounds larger
+            # values up to a multi-millisecond timer wait.
+            wait_key = cv2.waitKey(1)
             if wait_key in [ord("q"), ord("Q")]:
                 break
-        vcap.release()
+            time.sleep(max(0.0, next_tick - time.monotonic()))
         cv2.destroyAllWindows()
-        await self.run_action("exit_scan_mode")
+        self.app.call_from_thread(self.run_action, "exit_scan_mode")
 
     def restart_scanning(self) -> None:
         """Restart scanning for QR codes."""
-        self.log_widget.write("Restarting Scanninig!!!!")
-        self.set_timer(0.1, self.scan_qr_codes)  # Timer allows dialog to be dismissed.
+        self._log("Restarting Scanninig!!!!")
+        # The camera is still open and the loop runs on a worker thread,
+        # so scanning resumes immediately without a settle timer.
+        self.scan_qr_codes()
+
+    def _lookup_student(self, student_id: str) -> Optional[model.Student]:
+        """Fetch a student by ID, caching hits and misses alike."""
+        if student_id in self._student_cache:
+            return self._student_cache[student_id]
+        student = model.Student.get_by_id(self.dbase, student_id)
+        self._student_cache[student_id] = student
+        return student
 
     async def on_scan_screen_qr_code_found(self, message: QrCodeFound) -> None:
         """Add an attendance record to the database."""
         student_id = message.code
-        student = self._students.get(student_id)
+        student = self._lookup_student(student_id)
         if student is None:
-            self.log_widget.write(
+            self._log(
                 "[yellow]Unknown ID scanned,\nplease talk to a mentor.[/]"
             )
             return
         student_name = f"{student.first_name} {student.last_name}"
         if student_id in self._checkedin_students:
-            self.log_widget.write(f"[orange3]Already attended: {student_name}[/]")
+            self._log(f"[orange3]Already attended: {student_name}[/]")
         else:
             self._checkedin_students.add(student_id)
             timestamp = datetime.datetime.now()
+            # checkin_id of -1 marks a new record; the row is written by
+            # the next _flush_checkins batch.
             checkin = model.Checkin(
-                checkin_id=0,
+                checkin_id=-1,
                 student_id=student_id,
                 event_type=self.event_type,
                 timestamp=timestamp,
             )
-            checkin.add(self.dbase)
+            self._pending_checkins.append(checkin)
             self._write_checkin_message(student, checkin)
-        self.discard_scanned_code(student_id)
 
-    def _write_checkin_message(
-        self, student: model.Student, checkin: model.Checkin
-    ) -> None:
-        """Get message that's displayed on the screen when a student checks in."""
-        if not checkin.checkin_id:
-            self.log_widget.write(
+    def _log(self, log_message: str) -> None:
+        """Queue a message for the next batched log write."""
+        self._log_buffer.append(log_message)
+
+    def _flush_log(self) -> None:
+        """Write queued messages to the log widget in one refresh."""
+        if not self._log_buffer:
+            return
+        buffered = self._log_buffer
+        self._log_buffer = []
+        self.log_widget.write("\n".join(buffered))
+
+    def _flush_checkins(self) -> None:
+        """Write any pending checkins to the database in one transaction."""
+        if not self._pending_checkins:
+            return
+        pending = self._pending_checkins
+        self._pending_checkins = []
+        try:
+            model.Checkin.add_many(self.dbase, pending)
+        except sqlite3.Error:
+            self._log(
                 "\n[red]"
                 "************************* ERROR ********************************\n"
-                "** Valid QR code, but error occurred while recording checkin. **\n"
+                "**   Error occurred while recording checkins.                 **\n"
                 "**                 "
                 "[reverse]Please speak to a mentor.[/]                  **\n"
                 "****************************************************************"
                 "[/]\n"
             )
-            return
+
+    def _write_checkin_message(
+        self, student: model.Student, checkin: model.Checkin
+    ) -> None:
+        """Get message that's displayed on the screen when a student checks in.
+
+        Checkins are written by the next _flush_checkins batch, so there
+        is no per-checkin failure to report here; a failed batch raises
+        the error banner in _flush_checkins instead.
+        """
         if student.deactivated_on is None:
-            self.log_widget.write(
+            self._log(
                 f"[green]Success: {student.first_name} {student.last_name} "
                 f"checked in at {checkin.timestamp.strftime('%H:%M:%S')}[/]"
             )
         else:
-            self.log_widget.write(
+            self._log(
                 "\n[yellow]"
                 "*********************** WARNING ***********************************\n"
                 "** Your QR code has been marked as inactive! This is most likely **\n"
@@ -201,20 +343,12 @@ class ScanScreen(screen.Screen):
                 "[/]\n"
             )
 
-    # Tried using Textual's set_timer method, but that didn't work.
-    #   Non-threaded async workers didn't work either. Might be due to
-    #   OpenCV and while loop blocking calls?
-    @textual.work(exclusive=False, thread=True)
-    def discard_scanned_code(self, student_id: str) -> None:
-        """Allow a QR code to be scanned after five seconds have elapsed.."""
-        time.sleep(5)
-        self._scanned_students.discard(student_id)
-
     def action_exit_scan_mode(self) -> None:
         """Require a password to exit QR code scan mode."""
 
         def _exit_on_success(success: bool | None) -> None:
             if success:
+                self._flush_checkins()
                 self.app.pop_screen()
             else:
                 self.scan_qr_codes()
@@ -223,6 +357,17 @@ class ScanScreen(screen.Screen):
             submit_callback=_exit_on_success, exit_on_cancel=False
         )
 
+    def on_unmount(self) -> None:
+        """Release the camera and flush pending checkins on screen pop."""
+        # Stop the scan worker before pulling the capture out from under
+        # it; the loop checks is_cancelled each pass and exits through
+        # its destroyAllWindows path.
+        self.workers.cancel_all()
+        if self._vcap is not None:
+            self._vcap.release()
+            self._vcap = None
+        self._flush_checkins()
+
 
 @dataclasses.dataclass
 class DialogResult:
@@ -241,6 +386,14 @@ class ChooseTypeAndSurveyDialog(screen.ModalScreen[Optional[DialogResult]]):
     """Surveys that can be taken with attendance."""
     _default_survey_status_message: str = "Select a survey to view details"
     """Message shown when no survey is selected."""
+    _EVENT_OPTIONS = tuple(
+        option_list.Option(t.value.title(), id=t) for t in model.EventType
+    )
+    """Event-type options, built once; the types never change at runtime."""
+    _DEFAULT_HIGHLIGHT = next(
+        i for i, t in enumerate(model.EventType) if t is model.EventType.MEETING
+    )
+    """Index of the meeting event type, highlighted by default."""
 
     def __init__(self, dbase: model.DBase) -> None:
         super().__init__()
@@ -257,10 +410,7 @@ class ChooseTypeAndSurveyDialog(screen.ModalScreen[Optional[DialogResult]]):
                 with containers.Vertical():
                     yield widgets.Label("Event Type", classes="emphasis")
                     event_options = widgets.OptionList(
-                        *[
-                            option_list.Option(t.value.title(), id=t)
-                            for t in model.EventType
-                        ],
+                        *self._EVENT_OPTIONS,
                         id="event-type-option",
                     )
                     yield event_options
@@ -268,10 +418,9 @@ class ChooseTypeAndSurveyDialog(screen.ModalScreen[Optional[DialogResult]]):
                         "Select a Survey (optional)", classes="emphasis"
                     )
                     yield widgets.Select(
-                        [
-                            (survey.title, survey.title)
-                            for survey in self.surveys.values()
-                        ],
+                        # Titles are the dict keys, so iterate them
+                        # directly instead of materializing the values.
+                        tuple((title, title) for title in self.surveys),
                         allow_blank=True,
                         prompt="No Survey",
                         id="attendance-survey-select",
@@ -284,8 +433,7 @@ class ChooseTypeAndSurveyDialog(screen.ModalScreen[Optional[DialogResult]]):
             with containers.Horizontal(classes="ok-cancel-row"):
                 yield widgets.Button("Ok", id="event-type-select-ok-button")
                 yield widgets.Button("Cancel", id="event-type-select-cancel-button")
-        type_map = {opt.id: idx for idx, opt in enumerate(event_options.options)}
-        event_options.highlighted = type_map[model.EventType.MEETING]
+        event_options.highlighted = self._DEFAULT_HIGHLIGHT
 
     @textual.on(widgets.Select.Changed, "#attendance-survey-select")
     def update_survey_details(self, message: widgets.Select.Changed) -> None:
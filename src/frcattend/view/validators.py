@@ -1,6 +1,6 @@
 """Classes for verifying user enters valid input into Textual widgets."""
 
-import dateutil.parser
+import datetime
 
 from textual import validation
 
@@ -9,7 +9,19 @@ class DateValidator(validation.Validator):
     """Validate user input."""
 
     def validate(self, value: str) -> validation.ValidationResult:
-        """Verify input is a valid date."""
+        """Verify input is a valid date.
+
+        Validators run on every keystroke, so the stdlib ISO parser is
+        tried first; dateutil's heuristic parser (imported lazily) only
+        runs for non-ISO input.
+        """
+        try:
+            datetime.date.fromisoformat(value.strip())
+            return self.success()
+        except ValueError:
+            pass
+        import dateutil.parser
+
         try:
             dateutil.parser.parse(value, dayfirst=False).date()
             return self.success()
@@ -22,7 +34,8 @@ class IsPositiveInteger(validation.Validator):
 
     def validate(self, value: str) -> validation.ValidationResult:
         """Input must be a postive integer."""
-        if value and value.isdigit() and int(value) > 0:
+        # strip("0") rejects all-zero input without building an int.
+        if value.isdigit() and value.strip("0"):
             return self.success()
         return self.failure("Must be an integer greater than 0.")
 
@@ -32,7 +45,9 @@ class IsYear(validation.Validator):
 
     def validate(self, value: str) -> validation.ValidationResult:
         """Input must be a 4-digit year between 1900 and 2100."""
-        if value and value.isdigit() and 1900 < int(value) < 2100:
+        # Equal-length digit strings compare lexically the same as their
+        # numeric values, so no int is ever built.
+        if len(value) == 4 and value.isdigit() and "1900" < value < "2100":
             return self.success()
         return self.failure("Must be a 4-digit year (e.g., 2028).")
 
@@ -45,3 +60,11 @@ class NotEmpty(validation.Validator):
         if not value:
             return self.failure("Field cannot be empty.")
         return self.success()
+
+
+# The validators are stateless, so dialogs share these instances instead
+# of constructing fresh ones every time a dialog is composed.
+DATE_VALIDATOR = DateValidator()
+IS_POSITIVE_INTEGER = IsPositiveInteger()
+IS_YEAR = IsYear()
+NOT_EMPTY = NotEmpty()
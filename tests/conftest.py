@@ -16,6 +16,21 @@ PRIVATE_FOLDER = DATA_FOLDER / "private"
 OUTPUT_FOLDER = TEST_FOLDER / "output"
 CONFIG_PATH = PRIVATE_FOLDER / "test-config.toml"
 
+# Test databases are throwaway, so skip the per-commit fsync that the
+# default synchronous=NORMAL still pays on checkpoints. Appended at import
+# time so every pooled connection opened during the tests picks it up.
+model.database._CONNECTION_PRAGMAS += "PRAGMA synchronous = OFF;\n"
+
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    """Run tests that share fixtures next to each other.
+
+    Grouping by fixture set keeps cached fixtures (and the database files
+    they build) warm instead of thrashing between modules. The sort is
+    stable, so tests with the same fixtures keep their file order.
+    """
+    items.sort(key=lambda item: tuple(sorted(getattr(item, "fixturenames", ()))))
+
 
 @pytest.fixture()
 def empty_output_folder() -> pathlib.Path:
@@ -48,13 +63,35 @@ def empty_database(empty_output_folder: pathlib.Path) -> model.DBase:
     return model.DBase(OUTPUT_FOLDER / "testdatabase.db", create_new=True)
 
 
+@pytest.fixture(scope="session")
+def _full_db_template(tmp_path_factory: pytest.TempPathFactory) -> pathlib.Path:
+    """Seeded database file, built once per session.
+
+    Loading the JSON test data runs schema creation plus hundreds of
+    inserts; building it once and copying the finished file per test
+    turns that setup into a single file copy.
+    """
+    template = tmp_path_factory.mktemp("db-template") / "template.db"
+    dbase = model.DBase(template, create_new=True)
+    with open(DATA_FOLDER / "testdata-full.json") as jfile:
+        dbase.load_from_dict(json.load(jfile))
+    # Close idle connections so the WAL checkpoints into the main file
+    # before it is copied.
+    model.DBase.close_pool()
+    return template
+
+
 @pytest.fixture
-def full_dbase(empty_database: model.DBase) -> model.DBase:
+def full_dbase(
+    empty_output_folder: pathlib.Path, _full_db_template: pathlib.Path
+) -> model.DBase:
     """Database with students, appearances, and events."""
-    with open(DATA_FOLDER / "testdata-full.json") as jfile:
-        attendance_data = json.load(jfile)
-    empty_database.load_from_dict(attendance_data)
-    return empty_database
+    db_path = OUTPUT_FOLDER / "testdatabase.db"
+    shutil.copyfile(_full_db_template, db_path)
+    # The copy bypasses the write paths that normally invalidate the
+    # survey caches, so reset them by hand for each test.
+    model.surveys.clear_survey_caches()
+    return model.DBase(db_path)
 
 
 @pytest.fixture
@@ -41,6 +41,33 @@ def test_add_active_checkin(full_dbase: model.DBase) -> None:
     assert added_checkin.inactive == checkin.inactive
 
 
+def test_add_many_checkins(full_dbase: model.DBase) -> None:
+    """Add several checkins in a single transaction."""
+    # Arrange
+    student_ids = model.Student.get_all_ids(full_dbase, include_inactive=False)
+    event = model.Event(
+        datetime.date(2027, 2, 1), model.EventType.VIRTUAL, "Pytest Batch Event"
+    )
+    event.add(full_dbase)
+    checkins = [
+        model.Checkin(
+            -1,
+            student_id,
+            model.EventType.VIRTUAL,
+            datetime.datetime(2027, 2, 1, 17, 30),
+        )
+        for student_id in student_ids[:3]
+    ]
+    # Act
+    count = model.Checkin.add_many(full_dbase, checkins)
+    # Assert
+    assert count == len(checkins)
+    checkedin = model.Checkin.get_checkedin_students(
+        full_dbase, datetime.date(2027, 2, 1), model.EventType.VIRTUAL
+    )
+    assert set(checkedin) == set(student_ids[:3])
+
+
 def test_get_checkin_count(full_dbase: model.DBase) -> None:
     """Get number of checkins for an event."""
     # Arrange
@@ -27,6 +27,16 @@ def test_empty_database(empty_database: model.DBase) -> None:
     #   setting up for other tests.
 
 
+def test_database_uses_wal_mode(empty_database: model.DBase) -> None:
+    """New databases run in write-ahead-log mode so readers don't block writes."""
+    # Act
+    conn = empty_database.get_db_connection()
+    journal_mode = conn.execute("PRAGMA journal_mode;").fetchone()[0]
+    conn.close()
+    # Assert
+    assert journal_mode == "wal"
+
+
 def test_nonexistant_database_raises_error(empty_output_folder: pathlib.Path) -> None:
     """Raise an error if a database doesn't exist."""
     # Act, Assert
@@ -79,6 +89,41 @@ def test_attendance_report_data(full_dbase: model.DBase) -> None:
     cursor.connection.close()
 
 
+def test_attendance_student_objects(full_dbase: model.DBase) -> None:
+    """Materialize AttendanceStudent objects from the attendance query."""
+    # Act
+    students = model.Attendance.get_student_attendance_students(
+        full_dbase, include_inactive=True
+    )
+    # Assert
+    assert len(students) > 0
+    assert isinstance(students[0], model.AttendanceStudent)
+    for student in students:
+        assert isinstance(student.year_checkins, int)
+        assert isinstance(student.build_checkins, int)
+
+
+def test_attendance_query_plan_scans_checkins_once(full_dbase: model.DBase) -> None:
+    """The attendance report reads checkins with one scan and one join."""
+    from frcattend.model import attendance
+
+    # Act
+    conn = full_dbase.get_db_connection()
+    plan = [
+        row["detail"]
+        for row in conn.execute(
+            "EXPLAIN QUERY PLAN " + attendance._ATTENDANCE_QUERIES[False],
+            {"year_start": "2025-09-01", "build_start": "2026-01-01"},
+        )
+    ]
+    conn.close()
+    # Assert
+    checkin_scans = [
+        step for step in plan if step.startswith(("SCAN checkins", "SEARCH checkins"))
+    ]
+    assert len(checkin_scans) == 1
+
+
 def test_to_dict(full_dbase: model.DBase) -> None:
     """Save database contents to a JSON file."""
     # Act
@@ -95,6 +140,28 @@ def test_to_dict(full_dbase: model.DBase) -> None:
         json.dump(data, jfile, indent=2)
 
 
+def test_dump_json(full_dbase: model.DBase) -> None:
+    """Stream database contents to a JSON file."""
+    # Act
+    json_path = full_dbase.db_path.parent / "dumped.json"
+    full_dbase.dump_json(json_path)
+    # Assert: the streamed output parses and matches to_dict exactly.
+    with open(json_path) as jfile:
+        data = json.load(jfile)
+    assert data == full_dbase.to_dict()
+
+
+def test_dump_json_empty_database(empty_database: model.DBase) -> None:
+    """Empty tables still produce valid JSON from the streamed writer."""
+    # Act
+    json_path = empty_database.db_path.parent / "dumped-empty.json"
+    empty_database.dump_json(json_path)
+    # Assert
+    with open(json_path) as jfile:
+        data = json.load(jfile)
+    assert data == empty_database.to_dict()
+
+
 def test_from_dict(full_dbase: model.DBase, empty_database2: model.DBase) -> None:
     """Import student data from a dictionay into an empty database."""
     # Arrange
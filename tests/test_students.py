@@ -18,3 +18,16 @@ def test_get_students(full_dbase: model.DBase) -> None:
     assert all(isinstance(student, model.Student) for student in students)
     assert isinstance(students[0].grad_year, int)
     assert isinstance(students[0].deactivated_on, datetime.date)
+
+
+def test_get_all_ids_excludes_inactive(full_dbase: model.DBase) -> None:
+    """By default get_all_ids only returns active students."""
+    # Act
+    all_ids = model.Student.get_all_ids(full_dbase, include_inactive=True)
+    active_ids = model.Student.get_all_ids(full_dbase)
+    # Assert
+    active_students = {
+        student.student_id for student in model.Student.get_all(full_dbase)
+    }
+    assert len(active_ids) < len(all_ids)
+    assert set(active_ids) == active_students
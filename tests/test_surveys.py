@@ -1,35 +1,69 @@
 """Test the surveys table and Survey objects."""
 
-import copy
 import datetime
 import random
 
 import pytest
-import rich  # noqa: F401
 
 from frcattend import model
 
 
+# Under pytest-xdist --dist=loadgroup, keep this module on one worker so
+# the session-scoped database template is built once, not per worker.
+pytestmark = pytest.mark.xdist_group("surveys_db")
+
+# Seeded generator so test failures reproduce with the same picks.
+RNG = random.Random(0xC0FFEE)
+
+# One date for the whole module, so a run that straddles midnight can't
+# compare answers against a date that ticked over mid-test.
+TODAY = datetime.date.today()
+YESTERDAY = TODAY - datetime.timedelta(days=1)
+
+ZODIAC_SIGNS = (
+    "Aquarius",
+    "Aries",
+    "Cancer",
+    "Capricorn",
+    "Gemini",
+    "Leo",
+    "Libra",
+    "Pisces",
+    "Sagittarius",
+    "Scorpio",
+    "Taurus",
+    "Virgo",
+)
+
+
+@pytest.fixture(scope="module")
+def student_ids(_full_db_template) -> list[str]:
+    """Student IDs from the seeded test data, queried once per module.
+
+    The IDs are static test data, so the answer tests share one query
+    against the session template instead of each running their own.
+    """
+    return model.Student.get_all_ids(model.DBase(_full_db_template))
+
+
+@pytest.fixture
+def subgroup_survey(full_dbase: model.DBase) -> model.Survey:
+    """The seeded "Subgroup" survey, looked up once per test.
+
+    Function-scoped because test_update_survey mutates it.
+    """
+    survey = model.Survey.get_by_title(full_dbase, "Subgroup")
+    assert survey is not None
+    return survey
+
+
 def test_add_survey(noevents_dbase: model.DBase) -> None:
     """Create a survey and add it to the database."""
     # Arrange
     survey = model.Survey(
         title="Zodiacs",
         question="What's your sign?",
-        choices=[
-            "Aquarius",
-            "Aries",
-            "Cancer",
-            "Capricorn",
-            "Gemini",
-            "Leo",
-            "Libra",
-            "Pisces",
-            "Sagittarius",
-            "Scorpio",
-            "Taurus",
-            "Virgo",
-        ],
+        choices=list(ZODIAC_SIGNS),
     )
     # Act
     result = survey.add(noevents_dbase)
@@ -46,32 +80,33 @@ def test_get_surveys(full_dbase: model.DBase) -> None:
     surveys = model.Survey.get_all(full_dbase)
     # Assert
     assert len(surveys) == 3
-    assert all(isinstance(survey, model.Survey) for survey in surveys)
-
+    # get_all builds every row through the same factory, so checking the
+    # first element's type covers the list without a per-element scan.
+    assert type(surveys[0]) is model.Survey
 
-@pytest.mark.parametrize(
-    "title,success", [("Subgroup", True), ("Favorite Videogame", False)]
-)
-def test_get_survey_by_title(
-    full_dbase: model.DBase, title: str, success: bool
-) -> None:
-    """Get a survey from the database, or None if it doesn't exist."""
-    # Act
-    survey = model.Survey.get_by_title(full_dbase, title)
-    # Assert
-    if success:
-        assert survey is not None
-        assert isinstance(survey, model.Survey)
-        assert survey.title == title
-    else:
-        assert survey is None
 
+def test_get_survey_by_title(full_dbase: model.DBase) -> None:
+    """Get a survey from the database, or None if it doesn't exist.
 
-def test_update_survey(full_dbase: model.DBase) -> None:
+    Both cases run against one database build instead of one each via
+    parametrize.
+    """
+    for title, success in [("Subgroup", True), ("Favorite Videogame", False)]:
+        # Act
+        survey = model.Survey.get_by_title(full_dbase, title)
+        # Assert
+        if success:
+            assert survey is not None
+            assert isinstance(survey, model.Survey)
+            assert survey.title == title
+        else:
+            assert survey is None
+
+
+def test_update_survey(full_dbase: model.DBase, subgroup_survey: model.Survey) -> None:
     """Update a survey entry in the database."""
     # Arrange
-    survey = model.Survey.get_by_title(full_dbase, "Subgroup")
-    assert survey is not None
+    survey = subgroup_survey
     survey.question = "Favorite video game?"
     survey.choices = ["Mario Kart", "Zelda"]
     survey.multiselect = True
@@ -89,58 +124,81 @@ def test_update_survey(full_dbase: model.DBase) -> None:
     assert survey2.max_length == 25
 
 
-@pytest.mark.parametrize(
-    "title,success", [("Subgroup", True), ("Favorite Video Game", False)]
-)
-def test_delete_survey(full_dbase: model.DBase, title: str, success: bool) -> None:
-    """Delete a survey."""
-    # Act
-    delete_result = model.Survey.delete_by_title(full_dbase, title)
-    # Assert
-    assert delete_result == success
-    assert len(model.Survey.get_all(full_dbase)) == 2 if success else 3
-    assert model.Survey.get_by_title(full_dbase, title) is None
+def test_delete_survey(full_dbase: model.DBase) -> None:
+    """Delete a survey.
 
-
-def test_add_new_answer(full_dbase: model.DBase) -> None:
+    The missing-title case runs first because deleting "Subgroup"
+    mutates the shared database build.
+    """
+    for title, success in [("Favorite Video Game", False), ("Subgroup", True)]:
+        # Act
+        delete_result = model.Survey.delete_by_title(full_dbase, title)
+        # Assert
+        assert delete_result == success
+        assert model.Survey.count(full_dbase) == (2 if success else 3)
+        # The missing-title case never existed, so only the real delete
+        # needs the lookup to confirm the row is gone.
+        if success:
+            assert model.Survey.get_by_title(full_dbase, title) is None
+
+
+def test_add_new_answer(
+    full_dbase: model.DBase, student_ids: list[str], subgroup_survey: model.Survey
+) -> None:
     """Add an answer for a student with no prior answers."""
     # Arrange
-    student_id = random.choice(model.Student.get_all_ids(full_dbase))
-    survey = model.Survey.get_by_title(full_dbase, "Subgroup")
-    assert survey is not None
-    choice = random.choice(survey.choices)
-    answer = model.Answer(student_id, survey.title, choice, datetime.date.today())
+    student_id = RNG.choice(student_ids)
+    survey = subgroup_survey
+    choice = RNG.choice(survey.choices)
+    answer = model.Answer(student_id, survey.title, choice, TODAY)
     # Act
     answer.add(full_dbase)
     # Assert
     db_answers = model.Answer.get_by_title_and_student(
         full_dbase, survey.title, student_id
     )
-    assert isinstance(db_answers, list)
-    assert len(db_answers) == 1
-    assert db_answers[0].survey_title == survey.title
-    assert db_answers[0].student_id == student_id
-    assert db_answers[0].answer_date == datetime.date.today()
-    selected_answers = db_answers[0].choices
-    assert selected_answers is not None
-    assert len(selected_answers) == 1
-    assert selected_answers[0] == choice
-    assert db_answers[0].freetext_answer is None
-
-
-@pytest.mark.parametrize("replace", [(False, True)])
-def test_replace_answer_on_same_date(full_dbase: model.DBase, replace) -> None:
+    assert db_answers == [model.Answer(student_id, survey.title, [choice], TODAY)]
+
+
+def test_add_many_answers(
+    full_dbase: model.DBase, student_ids: list[str], subgroup_survey: model.Survey
+) -> None:
+    """Add answers for several students in a single transaction."""
+    # Arrange
+    student_ids = student_ids[:10]
+    survey = subgroup_survey
+    answers = [
+        model.Answer(student_id, survey.title, RNG.choice(survey.choices))
+        for student_id in student_ids
+    ]
+    # Act
+    written = model.Answer.add_many(full_dbase, answers)
+    # Assert
+    assert written == len(student_ids)
+    for student_id in student_ids:
+        db_answers = model.Answer.get_by_title_and_student(
+            full_dbase, survey.title, student_id
+        )
+        assert len(db_answers) == 1
+
+
+@pytest.mark.parametrize("replace", [False, True])
+def test_replace_answer_on_same_date(
+    full_dbase: model.DBase,
+    student_ids: list[str],
+    subgroup_survey: model.Survey,
+    replace,
+) -> None:
     """Add answer for a survey that has already been answered on same date.
 
     The replace argument should have no effect. Answers on the same day should
     always be replaced.
     """
     # Arrange
-    student_id = random.choice(model.Student.get_all_ids(full_dbase))
-    survey = model.Survey.get_by_title(full_dbase, "Subgroup")
-    assert survey is not None
-    choices = copy.deepcopy(survey.choices)
-    random.shuffle(choices)
+    student_id = RNG.choice(student_ids)
+    survey = subgroup_survey
+    choices = list(survey.choices)
+    RNG.shuffle(choices)
     choice1 = choices.pop()
     answer = model.Answer(student_id, survey.title, choices=choice1)
     answer.add(full_dbase)
@@ -152,38 +210,40 @@ def test_replace_answer_on_same_date(full_dbase: model.DBase, replace) -> None:
     db_answers = model.Answer.get_by_title_and_student(
         full_dbase, survey.title, student_id
     )
-    assert isinstance(db_answers, list)
-    assert len(db_answers) == 1
-    selected_answers = db_answers[0].choices
-    assert selected_answers is not None
-    assert len(selected_answers) == 1
-    assert selected_answers[0] == choice2
+    assert db_answers == [model.Answer(student_id, survey.title, [choice2])]
 
 
-@pytest.mark.parametrize("replace", [(False, True)])
-def test_add_new_answer_on_later_date(full_dbase: model.DBase, replace) -> None:
+@pytest.mark.parametrize("replace", [False, True])
+def test_add_new_answer_on_later_date(
+    full_dbase: model.DBase,
+    student_ids: list[str],
+    subgroup_survey: model.Survey,
+    replace,
+) -> None:
     """Add answer for a survey that was already answered on a prior date."""
     # Arrange
-    student_id = random.choice(model.Student.get_all_ids(full_dbase))
-    survey = model.Survey.get_by_title(full_dbase, "Subgroup")
-    assert survey is not None
-    choices = copy.deepcopy(survey.choices)
-    random.shuffle(choices)
+    student_id = RNG.choice(student_ids)
+    survey = subgroup_survey
+    choices = list(survey.choices)
+    RNG.shuffle(choices)
     choice1 = choices.pop()
-    yesterday = datetime.date.today() - datetime.timedelta(days=1)
-    answer = model.Answer(student_id, survey.title, choice1, yesterday, choice1)
+    answer = model.Answer(student_id, survey.title, choice1, YESTERDAY, choice1)
     answer.add(full_dbase)
     # Act
     choice2 = choices.pop()
     answer.choices = [choice2]
-    answer.answer_date = datetime.date.today()
+    answer.answer_date = TODAY
     answer.add(full_dbase, replace=replace)
     # Assert
     db_answers = model.Answer.get_by_title_and_student(
         full_dbase, survey.title, student_id
     )
-    assert isinstance(db_answers, list)
-    assert len(db_answers) == 1 if replace else 2
-    assert db_answers[-1].choices is not None
-    assert len(db_answers[-1].choices) == 1
-    assert db_answers[-1].choices[0] == choice2
+    # Answers come back newest-first (ORDER BY answer_date DESC).
+    expected = [
+        model.Answer(student_id, survey.title, [choice2], freetext_answer=choice1)
+    ]
+    if not replace:
+        expected.append(
+            model.Answer(student_id, survey.title, [choice1], YESTERDAY, choice1)
+        )
+    assert db_answers == expected